@@ -3,6 +3,8 @@ from functools import lru_cache
 from src.infrastructure.llm.blackbox_client import BlackboxClient
 from src.infrastructure.vector_store.qdrant_client import QdrantClient
 from src.infrastructure.vector_store.embedding_service import EmbeddingService
+from src.infrastructure.vector_store.fastembed_service import FastEmbedService
+from src.domain.interfaces.embedding_provider import EmbeddingProvider
 from src.application.services.forecast_service import ForecastService
 from src.application.services.insight_service import InsightService
 from src.application.services.qa_service import QAService
@@ -17,6 +19,9 @@ from src.application.use_cases.generate_forecast import GenerateForecastUseCase
 from src.application.use_cases.generate_insight import GenerateInsightUseCase
 from src.application.use_cases.analyze_event import AnalyzeEventUseCase
 from src.application.use_cases.parse_alert import ParseAlertUseCase
+from src.application import container
+from src.shared.config import get_settings
+from src.shared.constants import EMBEDDING_BACKEND_FASTEMBED
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -38,26 +43,29 @@ def get_vector_store() -> QdrantClient:
 
 
 @lru_cache()
-def get_embedding_service() -> EmbeddingService:
-    """Get embedding service singleton."""
-    logger.debug("Creating embedding service instance")
+def get_embedding_service() -> EmbeddingProvider:
+    """Get embedding service singleton for the configured backend."""
+    backend = get_settings().embedding_backend
+    logger.debug(f"Creating embedding service instance (backend={backend})")
+    if backend == EMBEDDING_BACKEND_FASTEMBED:
+        return FastEmbedService()
     return EmbeddingService()
 
 
-# Application services
+# Application services (constructed once per set of providers, see src.application.container)
 def get_forecast_service() -> ForecastService:
-    """Get forecast service instance."""
-    return ForecastService(get_llm_provider())
+    """Get forecast service singleton."""
+    return container.forecast_service(get_llm_provider())
 
 
 def get_insight_service() -> InsightService:
-    """Get insight service instance."""
-    return InsightService(get_llm_provider())
+    """Get insight service singleton."""
+    return container.insight_service(get_llm_provider())
 
 
 def get_qa_service() -> QAService:
-    """Get QA service instance."""
-    return QAService(
+    """Get QA service singleton."""
+    return container.qa_service(
         get_llm_provider(),
         get_vector_store(),
         get_embedding_service()
@@ -65,28 +73,28 @@ def get_qa_service() -> QAService:
 
 
 def get_summarization_service() -> SummarizationService:
-    """Get summarization service instance."""
-    return SummarizationService(get_llm_provider())
+    """Get summarization service singleton (shares its summary cache across requests)."""
+    return container.summarization_service(get_llm_provider())
 
 
 def get_sentiment_service() -> SentimentService:
-    """Get sentiment service instance."""
-    return SentimentService(get_llm_provider())
+    """Get sentiment service singleton."""
+    return container.sentiment_service(get_llm_provider())
 
 
 def get_nlp_parser_service() -> NLPParserService:
-    """Get NLP parser service instance."""
-    return NLPParserService(get_llm_provider())
+    """Get NLP parser service singleton."""
+    return container.nlp_parser_service(get_llm_provider())
 
 
 def get_stock_data_service() -> StockDataService:
-    """Get stock data service instance."""
-    return StockDataService()
+    """Get stock data service singleton (shares its quote cache across requests)."""
+    return container.stock_data_service()
 
 
 def get_rag_ingest_service() -> RagIngestService:
-    """Get RAG ingest service instance."""
-    return RagIngestService(
+    """Get RAG ingest service singleton."""
+    return container.rag_ingest_service(
         get_vector_store(),
         get_embedding_service()
     )
@@ -94,30 +102,30 @@ def get_rag_ingest_service() -> RagIngestService:
 
 # Use cases
 def get_summarize_news_use_case() -> SummarizeNewsUseCase:
-    """Get summarize news use case instance."""
-    return SummarizeNewsUseCase(get_summarization_service())
+    """Get summarize news use case singleton."""
+    return container.summarize_news_use_case(get_summarization_service())
 
 
 def get_answer_question_use_case() -> AnswerQuestionUseCase:
-    """Get answer question use case instance."""
-    return AnswerQuestionUseCase(get_qa_service())
+    """Get answer question use case singleton."""
+    return container.answer_question_use_case(get_qa_service())
 
 
 def get_generate_forecast_use_case() -> GenerateForecastUseCase:
-    """Get generate forecast use case instance."""
-    return GenerateForecastUseCase(get_forecast_service())
+    """Get generate forecast use case singleton."""
+    return container.generate_forecast_use_case(get_forecast_service())
 
 
 def get_generate_insight_use_case() -> GenerateInsightUseCase:
-    """Get generate insight use case instance."""
-    return GenerateInsightUseCase(get_insight_service())
+    """Get generate insight use case singleton."""
+    return container.generate_insight_use_case(get_insight_service())
 
 
 def get_analyze_event_use_case() -> AnalyzeEventUseCase:
-    """Get analyze event use case instance."""
-    return AnalyzeEventUseCase(get_sentiment_service())
+    """Get analyze event use case singleton."""
+    return container.analyze_event_use_case(get_sentiment_service())
 
 
 def get_parse_alert_use_case() -> ParseAlertUseCase:
-    """Get parse alert use case instance."""
-    return ParseAlertUseCase(get_nlp_parser_service())
+    """Get parse alert use case singleton."""
+    return container.parse_alert_use_case(get_nlp_parser_service())
@@ -3,7 +3,9 @@ import time
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from src.api.dependencies import get_llm_provider
 from src.api.routes import summarize, analyze, forecast, qa, alert_nlp, stock_data, insights, answer_context, rag
+from src.infrastructure.llm.http_client import close_http_client
 from src.shared.config import get_settings
 from src.shared.exceptions import (
     AIServiceException,
@@ -36,11 +38,16 @@ app.add_middleware(
 )
 
 
+def _generate_request_id() -> str:
+    """Generate a unique ID for an incoming request."""
+    return str(uuid.uuid4())
+
+
 @app.middleware("http")
 async def add_request_metadata(request: Request, call_next):
     """Add request ID and track request metadata for logging."""
     start_time = time.time()
-    request_id = str(uuid.uuid4())
+    request_id = _generate_request_id()
     set_request_id(request_id)
     
     response = await call_next(request)
@@ -64,6 +71,14 @@ async def add_request_metadata(request: Request, call_next):
     return response
 
 
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    """Close the shared LLM HTTP connection pool."""
+    await close_http_client()
+    # The cached LLM provider holds the closed pool; rebuild it on next use
+    get_llm_provider.cache_clear()
+
+
 # Global exception handlers
 @app.exception_handler(LLMQuotaExceededError)
 async def llm_quota_exceeded_handler(request: Request, exc: LLMQuotaExceededError):
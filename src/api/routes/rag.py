@@ -1,11 +1,10 @@
 """RAG (Retrieval-Augmented Generation) API routes."""
-import os
 from fastapi import APIRouter, Depends, Header, HTTPException, status
 from pydantic import BaseModel, Field, field_validator
 from typing import Dict, Any, Optional
 from src.application.services.rag_ingest_service import RagIngestService
 from src.api.dependencies import get_rag_ingest_service
-from src.shared.config import get_settings
+from src.shared.config import Config, get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -58,18 +57,21 @@ class DeleteResponse(BaseModel):
     status: str = Field(..., description="Status string")
 
 
-def validate_api_key(x_internal_api_key: Optional[str] = Header(None)):
+def validate_api_key(
+    x_internal_api_key: Optional[str] = Header(None),
+    settings: Config = Depends(get_settings)
+):
     """
     Validate internal API key header.
     
     Args:
         x_internal_api_key: API key from X-Internal-Api-Key header
+        settings: Application settings (overridable in tests)
         
     Raises:
         HTTPException: 401 if key is missing or invalid
     """
-    settings = get_settings()
-    expected_key = getattr(settings, "internal_api_key", None) or os.getenv("INTERNAL_API_KEY")
+    expected_key = settings.internal_api_key
     
     # Validate
     if not expected_key:
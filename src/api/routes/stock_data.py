@@ -112,7 +112,7 @@ async def get_multiple_quotes(
     Returns:
         List of stock quotes
     """
-    quotes = stock_service.get_multiple_quotes(symbols, source)
+    quotes = await stock_service.aget_multiple_quotes(symbols, source)
     return quotes
 
 
@@ -173,5 +173,5 @@ async def get_vn30_quotes(
         'MWG', 'HDB', 'ACB', 'TPB', 'STB', 'PDR', 'VIB', 'BCM', 'KDH', 'NVL'
     ]
     
-    quotes = stock_service.get_multiple_quotes(vn30_symbols, source)
+    quotes = await stock_service.aget_multiple_quotes(vn30_symbols, source)
     return quotes
@@ -1,6 +1,7 @@
 """Summarize API routes."""
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
+from typing import List
 from src.application.use_cases.summarize_news import SummarizeNewsUseCase
 from src.api.dependencies import get_summarize_news_use_case
 
@@ -19,6 +20,16 @@ class SummarizeResponse(BaseModel):
     impact_assessment: str
 
 
+class SummarizeBatchRequest(BaseModel):
+    """Request model for batch news summarization."""
+    contents: List[str]
+
+
+class SummarizeBatchResponse(BaseModel):
+    """Response model for batch summaries."""
+    summaries: List[SummarizeResponse]
+
+
 @router.post("/summarize", response_model=SummarizeResponse)
 async def summarize_news(
     request: SummarizeRequest,
@@ -40,3 +51,31 @@ async def summarize_news(
         sentiment=result["sentiment"],
         impact_assessment=result["impact_assessment"]
     )
+
+
+@router.post("/summarize/batch", response_model=SummarizeBatchResponse)
+async def summarize_news_batch(
+    request: SummarizeBatchRequest,
+    use_case: SummarizeNewsUseCase = Depends(get_summarize_news_use_case)
+):
+    """
+    Summarize multiple news articles with batched LLM calls.
+
+    Args:
+        request: Batch summarize request with article contents
+        use_case: Summarize news use case instance
+
+    Returns:
+        Summaries in the same order as the request contents
+    """
+    results = await use_case.execute_many(request.contents)
+    return SummarizeBatchResponse(
+        summaries=[
+            SummarizeResponse(
+                summary=result["summary"],
+                sentiment=result["sentiment"],
+                impact_assessment=result["impact_assessment"]
+            )
+            for result in results
+        ]
+    )
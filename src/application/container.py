@@ -0,0 +1,123 @@
+"""Lazy singleton factories for application services and use cases.
+
+Each factory is memoized on its injected dependencies, so given the same
+provider instances (the API layer passes its infrastructure singletons) a
+service or use case is constructed once per process instead of per request.
+Passing different providers (e.g. mocks in tests) builds a fresh instance;
+a few entries are kept per factory so alternating providers do not evict
+each other on every call.
+"""
+from functools import lru_cache
+from src.domain.interfaces.llm_provider import LLMProvider
+from src.domain.interfaces.vector_store import VectorStore
+from src.domain.interfaces.embedding_provider import EmbeddingProvider
+from src.application.services.forecast_service import ForecastService
+from src.application.services.insight_service import InsightService
+from src.application.services.qa_service import QAService
+from src.application.services.summarization_service import SummarizationService
+from src.application.services.sentiment_service import SentimentService
+from src.application.services.nlp_parser_service import NLPParserService
+from src.application.services.stock_data_service import StockDataService
+from src.application.services.rag_ingest_service import RagIngestService
+from src.application.use_cases.summarize_news import SummarizeNewsUseCase
+from src.application.use_cases.answer_question import AnswerQuestionUseCase
+from src.application.use_cases.generate_forecast import GenerateForecastUseCase
+from src.application.use_cases.generate_insight import GenerateInsightUseCase
+from src.application.use_cases.analyze_event import AnalyzeEventUseCase
+from src.application.use_cases.parse_alert import ParseAlertUseCase
+
+# Instances kept per factory (one per distinct set of injected providers)
+_FACTORY_CACHE_SIZE = 8
+
+
+# Services
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def forecast_service(llm_provider: LLMProvider) -> ForecastService:
+    """Get the forecast service for an LLM provider."""
+    return ForecastService(llm_provider)
+
+
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def insight_service(llm_provider: LLMProvider) -> InsightService:
+    """Get the insight service for an LLM provider."""
+    return InsightService(llm_provider)
+
+
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def qa_service(
+    llm_provider: LLMProvider,
+    vector_store: VectorStore,
+    embedding_service: EmbeddingProvider
+) -> QAService:
+    """Get the QA service for its providers."""
+    return QAService(llm_provider, vector_store, embedding_service)
+
+
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def summarization_service(llm_provider: LLMProvider) -> SummarizationService:
+    """Get the summarization service (shares its summary cache across requests)."""
+    return SummarizationService(llm_provider)
+
+
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def sentiment_service(llm_provider: LLMProvider) -> SentimentService:
+    """Get the sentiment service for an LLM provider."""
+    return SentimentService(llm_provider)
+
+
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def nlp_parser_service(llm_provider: LLMProvider) -> NLPParserService:
+    """Get the NLP parser service for an LLM provider."""
+    return NLPParserService(llm_provider)
+
+
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def stock_data_service() -> StockDataService:
+    """Get the stock data service (shares its quote cache across requests)."""
+    return StockDataService()
+
+
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def rag_ingest_service(
+    vector_store: VectorStore,
+    embedding_service: EmbeddingProvider
+) -> RagIngestService:
+    """Get the RAG ingest service for its providers."""
+    return RagIngestService(vector_store, embedding_service)
+
+
+# Use cases
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def summarize_news_use_case(service: SummarizationService) -> SummarizeNewsUseCase:
+    """Get the summarize news use case for a summarization service."""
+    return SummarizeNewsUseCase(service)
+
+
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def answer_question_use_case(service: QAService) -> AnswerQuestionUseCase:
+    """Get the answer question use case for a QA service."""
+    return AnswerQuestionUseCase(service)
+
+
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def generate_forecast_use_case(service: ForecastService) -> GenerateForecastUseCase:
+    """Get the generate forecast use case for a forecast service."""
+    return GenerateForecastUseCase(service)
+
+
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def generate_insight_use_case(service: InsightService) -> GenerateInsightUseCase:
+    """Get the generate insight use case for an insight service."""
+    return GenerateInsightUseCase(service)
+
+
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def analyze_event_use_case(service: SentimentService) -> AnalyzeEventUseCase:
+    """Get the analyze event use case for a sentiment service."""
+    return AnalyzeEventUseCase(service)
+
+
+@lru_cache(maxsize=_FACTORY_CACHE_SIZE)
+def parse_alert_use_case(service: NLPParserService) -> ParseAlertUseCase:
+    """Get the parse alert use case for an NLP parser service."""
+    return ParseAlertUseCase(service)
@@ -1,15 +1,12 @@
 """Forecast service for generating stock forecasts."""
+import copy
 import json
 import re
 from typing import Dict, Any, Optional
 from src.domain.interfaces.llm_provider import LLMProvider
 from src.application.services.prompt_builder import PromptBuilder
-from src.shared.utils import (
-    extract_trend,
-    extract_confidence,
-    extract_recommendation,
-    extract_list_items
-)
+from src.shared.utils import analyze_response, extract_list_items
+from src.shared.single_flight import SingleFlight
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -26,6 +23,7 @@ class ForecastService:
             llm_provider: LLM provider for generating forecasts
         """
         self.llm_provider = llm_provider
+        self._single_flight = SingleFlight()
         logger.info("Initialized ForecastService")
 
     async def generate_forecast(
@@ -39,6 +37,8 @@ class ForecastService:
         """
         Generate AI-based stock forecast using multiple data sources.
 
+        Concurrent calls with identical inputs share a single LLM call.
+
         Args:
             symbol: Stock symbol (e.g., VIC, VNM)
             technical_data: Technical indicators (MA, RSI, MACD, etc.)
@@ -49,6 +49,24 @@ class ForecastService:
         Returns:
             Forecast with trend, confidence, price targets, and analysis
         """
+        key = SingleFlight.key(symbol, technical_data, fundamental_data, sentiment_data, time_horizon)
+        result = await self._single_flight.do(
+            key,
+            lambda: self._generate_forecast(
+                symbol, technical_data, fundamental_data, sentiment_data, time_horizon
+            )
+        )
+        return copy.deepcopy(result)
+
+    async def _generate_forecast(
+        self,
+        symbol: str,
+        technical_data: Optional[Dict[str, Any]] = None,
+        fundamental_data: Optional[Dict[str, Any]] = None,
+        sentiment_data: Optional[Dict[str, Any]] = None,
+        time_horizon: str = "short"
+    ) -> Dict[str, Any]:
+        """Generate a forecast with one LLM call (no coalescing)."""
         logger.info(f"Generating forecast for {symbol} with time_horizon={time_horizon}")
         
         # Build comprehensive prompt
@@ -83,14 +101,11 @@ class ForecastService:
         """Parse AI response into structured forecast."""
         logger.debug(f"Parsing forecast response for {symbol}")
 
-        # Extract trend
-        trend = extract_trend(response)
-
-        # Extract confidence level
-        confidence, confidence_score = extract_confidence(response)
-
-        # Extract recommendation
-        recommendation = extract_recommendation(response)
+        # Extract trend, confidence level and recommendation in one keyword scan
+        analysis = analyze_response(response)
+        trend = analysis["trend"]
+        confidence, confidence_score = analysis["confidence"]
+        recommendation = analysis["recommendation"]
 
         # Extract key drivers and risks
         key_drivers = extract_list_items(response, ["yếu tố", "driver", "lý do"])
@@ -1,8 +1,10 @@
 """QA service for answering questions with RAG."""
+import copy
 from typing import Dict, Any, Optional, List
 from src.domain.interfaces.llm_provider import LLMProvider
 from src.domain.interfaces.vector_store import VectorStore
 from src.domain.interfaces.embedding_provider import EmbeddingProvider
+from src.shared.single_flight import SingleFlight
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -28,6 +30,7 @@ class QAService:
         self.llm_provider = llm_provider
         self.vector_store = vector_store
         self.embedding_service = embedding_service
+        self._single_flight = SingleFlight()
         logger.info("Initialized QAService")
 
     async def answer_question(
@@ -42,6 +45,9 @@ class QAService:
         """
         Answer a question using RAG with optional filters.
         
+        Concurrent calls with identical arguments share a single retrieval and
+        LLM call.
+        
         Args:
             question: The question to answer
             base_context: Base context from caller (optional)
@@ -53,6 +59,25 @@ class QAService:
         Returns:
             Dictionary with answer and sources (list of objects)
         """
+        key = SingleFlight.key(question, base_context, top_k, document_id, source, symbol)
+        result = await self._single_flight.do(
+            key,
+            lambda: self._answer_question(
+                question, base_context, top_k, document_id, source, symbol
+            )
+        )
+        return copy.deepcopy(result)
+
+    async def _answer_question(
+        self,
+        question: str,
+        base_context: Optional[str] = None,
+        top_k: int = 6,
+        document_id: Optional[str] = None,
+        source: Optional[str] = None,
+        symbol: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Answer a question with one retrieval and LLM call (no coalescing)."""
         logger.info(
             f"Answering question: {question[:100]}... "
             f"(filters: documentId={document_id}, source={source}, symbol={symbol})"
@@ -1,6 +1,7 @@
 """RAG ingest service for chunking and embedding documents into Qdrant."""
 import re
-from typing import Dict, Any, List, Optional
+import uuid
+from typing import Dict, Any, List, Optional, Tuple
 from src.domain.interfaces.vector_store import VectorStore
 from src.domain.interfaces.embedding_provider import EmbeddingProvider
 from src.shared.logging import get_logger
@@ -11,10 +12,16 @@ logger = get_logger(__name__)
 DEFAULT_CHUNK_SIZE = 1200
 DEFAULT_CHUNK_OVERLAP = 200
 
+# Sentence boundary: whitespace following terminal punctuation
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?…])\s+")
+
 
 class RagIngestService:
     """Service for ingesting documents into RAG vector store."""
     
+    # Namespace for deterministic UUIDv5 point IDs (Qdrant accepts only int/UUID IDs)
+    _NS = uuid.UUID("6f1c2b8e-4d3a-5e9f-a7b1-0c2d3e4f5a6b")
+    
     def __init__(
         self,
         vector_store: VectorStore,
@@ -79,26 +86,31 @@ class RagIngestService:
         if resolved_chunk_overlap >= resolved_chunk_size:
             resolved_chunk_overlap = max(0, resolved_chunk_size - 1)
 
-        chunks = self._chunk_text(text, resolved_chunk_size, resolved_chunk_overlap)
+        chunks = self._filter_chunks(
+            self._chunk_text(text, resolved_chunk_size, resolved_chunk_overlap)
+        )
         logger.info(f"Created {len(chunks)} chunks for document {document_id}")
 
-        payloads: List[Dict[str, Any]] = []
-        vectors: List[List[float]] = []
+        # Hash the document ID once; each chunk only hashes its index suffix
+        doc_ns = uuid.uuid5(self._NS, document_id)
 
-        for chunk_index, chunk_text in enumerate(chunks):
-            embedding = await self.embedding_provider.generate_embedding(chunk_text)
-            chunk_id = f"{document_id}:{chunk_index}"
-            payloads.append({
+        payloads: List[Dict[str, Any]] = [
+            {
                 "documentId": document_id,
                 "source": source,
                 "sourceUrl": source_url,
                 "title": title,
                 "section": section,
                 "symbol": symbol,
-                "chunkId": chunk_id,
+                "chunkId": str(uuid.uuid5(doc_ns, str(chunk_index))),
                 "text": chunk_text
-            })
-            vectors.append(embedding)
+            }
+            for chunk_index, chunk_text in enumerate(chunks)
+        ]
+
+        # Embed all chunks in one batch call instead of one call per chunk,
+        # kept as a contiguous float32 array until the vector store boundary
+        vectors = await self.embedding_provider.generate_embeddings_np(chunks)
 
         await self.vector_store.upsert_chunks(
             document_id=document_id,
@@ -138,11 +150,16 @@ class RagIngestService:
 
         chunks: List[str] = []
         current = ""
+        current_len = 0
+        # Measure each paragraph once; lengths are summed instead of re-measuring candidates
+        sep_len = len("\n\n")
 
         for paragraph in paragraphs:
-            candidate = f"{current}\n\n{paragraph}" if current else paragraph
-            if len(candidate) <= chunk_size:
-                current = candidate
+            para_len = len(paragraph)
+            candidate_len = current_len + sep_len + para_len if current else para_len
+            if candidate_len <= chunk_size:
+                current = f"{current}\n\n{paragraph}" if current else paragraph
+                current_len = candidate_len
                 continue
 
             if current:
@@ -150,21 +167,84 @@ class RagIngestService:
                 if chunk_overlap > 0:
                     overlap_text = current[-chunk_overlap:]
                     current = f"{overlap_text}\n\n{paragraph}"
+                    current_len = len(overlap_text) + sep_len + para_len
                 else:
                     current = paragraph
+                    current_len = para_len
             else:
                 current = paragraph
+                current_len = para_len
 
-            if len(current) > chunk_size:
+            if current_len > chunk_size:
                 chunks.extend(self._hard_split(current, chunk_size, chunk_overlap))
                 current = ""
+                current_len = 0
 
         if current:
             chunks.append(current)
 
         return [chunk.strip() for chunk in chunks if chunk.strip()]
 
+    def _filter_chunks(self, chunks: List[str]) -> List[str]:
+        """Drop whitespace-only chunks and exact duplicates, keeping order.
+
+        Short chunks are kept: a document's tail chunk is often short but
+        still carries content that must stay searchable.
+        """
+        seen = set()
+        unique: List[str] = []
+        for chunk in chunks:
+            if not chunk.strip() or chunk in seen:
+                continue
+            seen.add(chunk)
+            unique.append(chunk)
+        return unique
+
     def _hard_split(self, text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
+        """Split long text on sentence boundaries, packing sentences up to chunk_size.
+
+        Trailing sentences of the previous chunk (up to chunk_overlap) are
+        carried over as context. Sentences longer than chunk_size fall back to
+        fixed-size character windows.
+        """
+        sentences = [s for s in _SENTENCE_BOUNDARY_RE.split(text) if s.strip()]
+        sep_len = len(" ")
+        chunks: List[str] = []
+        current: List[Tuple[str, int]] = []
+        current_len = 0
+
+        for sentence in sentences:
+            sentence_len = len(sentence)
+            if sentence_len > chunk_size:
+                if current:
+                    chunks.append(" ".join(s for s, _ in current))
+                    current, current_len = [], 0
+                chunks.extend(self._char_split(sentence, chunk_size, chunk_overlap))
+                continue
+
+            if current and current_len + sep_len + sentence_len > chunk_size:
+                chunks.append(" ".join(s for s, _ in current))
+                # Carry over trailing sentences that fit both the overlap and the next chunk
+                limit = min(chunk_overlap, chunk_size - sentence_len - sep_len)
+                tail: List[Tuple[str, int]] = []
+                tail_len = 0
+                for previous, previous_len in reversed(current):
+                    extra = previous_len + (sep_len if tail else 0)
+                    if tail_len + extra > limit:
+                        break
+                    tail.insert(0, (previous, previous_len))
+                    tail_len += extra
+                current, current_len = tail, tail_len
+
+            current_len += sentence_len + (sep_len if current else 0)
+            current.append((sentence, sentence_len))
+
+        if current:
+            chunks.append(" ".join(s for s, _ in current))
+
+        return [chunk.strip() for chunk in chunks if chunk.strip()]
+
+    def _char_split(self, text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
         """Split long text into fixed-size overlapping chunks."""
         chunks: List[str] = []
         start = 0
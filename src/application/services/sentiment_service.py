@@ -1,10 +1,17 @@
 """Sentiment analysis service for events."""
+import copy
+import re
 from typing import Dict, Any
 from src.domain.interfaces.llm_provider import LLMProvider
+from src.shared.single_flight import SingleFlight
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Single-pass, case-insensitive impact classifiers (no lower() copy needed)
+_POS_RE = re.compile(r'positive|increase|tích cực', re.IGNORECASE)
+_NEG_RE = re.compile(r'negative|decrease|tiêu cực', re.IGNORECASE)
+
 
 class SentimentService:
     """Service for analyzing sentiment of corporate events."""
@@ -17,18 +24,29 @@ class SentimentService:
             llm_provider: LLM provider for sentiment analysis
         """
         self.llm_provider = llm_provider
+        self._single_flight = SingleFlight()
         logger.info("Initialized SentimentService")
 
     async def analyze_event(self, event_description: str) -> Dict[str, Any]:
         """
         Analyze corporate event and assess its impact.
         
+        Concurrent calls for the same event share a single LLM call.
+        
         Args:
             event_description: Description of the corporate event
             
         Returns:
             Dictionary with analysis and impact assessment
         """
+        result = await self._single_flight.do(
+            SingleFlight.key(event_description),
+            lambda: self._analyze_event(event_description)
+        )
+        return copy.deepcopy(result)
+
+    async def _analyze_event(self, event_description: str) -> Dict[str, Any]:
+        """Analyze an event with one LLM call (no coalescing)."""
         logger.info(f"Analyzing event: {event_description[:100]}...")
         
         prompt = f"""Analyze the following corporate event and assess its impact:
@@ -45,10 +63,9 @@ Please provide:
             logger.debug("Received sentiment analysis response")
             
             impact = "neutral"
-            response_lower = response.lower()
-            if "positive" in response_lower or "increase" in response_lower:
+            if _POS_RE.search(response):
                 impact = "positive"
-            elif "negative" in response_lower or "decrease" in response_lower:
+            elif _NEG_RE.search(response):
                 impact = "negative"
             
             logger.info(f"Event analysis completed with impact: {impact}")
@@ -1,5 +1,8 @@
 """Stock Data Service - Lấy dữ liệu chứng khoán từ vnstock."""
-from typing import List, Optional, Dict, Any
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 import pandas as pd
 from vnstock import Vnstock, Listing
@@ -12,10 +15,44 @@ logger = get_logger(__name__)
 class StockDataService:
     """Service để lấy dữ liệu chứng khoán từ vnstock"""
     
+    # Giới hạn số request vnstock chạy song song (network-bound, chạy trong thread)
+    MAX_CONCURRENT_QUOTES = 8
+    # Số client vnstock tối đa được giữ lại (LRU) để tái sử dụng HTTP session
+    MAX_STOCK_CLIENTS = 256
+    
     def __init__(self):
         self.listing = Listing()
         self._cache = {}
         self._cache_ttl = 60  # Cache 60 giây cho real-time data
+        self._stock_clients: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._stock_clients_lock = threading.Lock()
+    
+    def _get_client(self, symbol: str, source: str) -> Any:
+        """
+        Lấy client vnstock đã cache cho (symbol, source), tạo mới nếu chưa có
+        
+        Args:
+            symbol: Mã chứng khoán
+            source: Nguồn dữ liệu
+        
+        Returns:
+            vnstock stock client
+        """
+        key = (symbol.upper(), source)
+        with self._stock_clients_lock:
+            client = self._stock_clients.get(key)
+            if client is not None:
+                self._stock_clients.move_to_end(key)
+                return client
+
+        client = Vnstock().stock(symbol=key[0], source=source)
+
+        with self._stock_clients_lock:
+            self._stock_clients[key] = client
+            self._stock_clients.move_to_end(key)
+            while len(self._stock_clients) > self.MAX_STOCK_CLIENTS:
+                self._stock_clients.popitem(last=False)
+        return client
     
     def get_all_symbols(self, exchange: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -60,7 +97,7 @@ class StockDataService:
             ServiceUnavailableError: If unable to fetch data from source
         """
         try:
-            stock = Vnstock().stock(symbol=symbol.upper(), source=source)
+            stock = self._get_client(symbol, source)
             
             # Lấy dữ liệu 2 ngày gần nhất để tính change
             end_date = datetime.now()
@@ -116,6 +153,29 @@ class StockDataService:
         
         return quotes
     
+    async def aget_multiple_quotes(self, symbols: List[str], source: str = 'VCI') -> List[Dict[str, Any]]:
+        """
+        Lấy giá của nhiều mã chứng khoán song song
+        
+        vnstock là thư viện đồng bộ nên mỗi mã được lấy trong một worker thread,
+        giới hạn bởi MAX_CONCURRENT_QUOTES.
+        
+        Args:
+            symbols: Danh sách mã chứng khoán
+            source: Nguồn dữ liệu
+        
+        Returns:
+            List of stock quotes (giữ nguyên thứ tự của symbols)
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_QUOTES)
+
+        async def fetch(symbol: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(self.get_stock_quote, symbol, source)
+
+        results = await asyncio.gather(*(fetch(symbol) for symbol in symbols))
+        return [quote for quote in results if quote]
+    
     def get_historical_data(
         self,
         symbol: str,
@@ -142,7 +202,7 @@ class StockDataService:
             ServiceUnavailableError: If unable to fetch data from source
         """
         try:
-            stock = Vnstock().stock(symbol=symbol.upper(), source=source)
+            stock = self._get_client(symbol, source)
             df = stock.quote.history(start=start_date, end=end_date, interval=interval)
             
             if df.empty:
@@ -1,15 +1,67 @@
 """Summarization service for news articles."""
-import json
-from typing import Dict, Any
+import asyncio
+import copy
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+import orjson
 from src.domain.interfaces.llm_provider import LLMProvider
+from src.shared.single_flight import SingleFlight
 from src.shared.utils import extract_sentiment
+from src.shared.constants import SUMMARY_BATCH_SIZE, SUMMARY_CACHE_MAX_SIZE
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+_POSITIVE_SENTIMENT_RE = re.compile(r'positive|tích cực', re.IGNORECASE)
+_NEGATIVE_SENTIMENT_RE = re.compile(r'negative|tiêu cực', re.IGNORECASE)
+# Leading ```json / ``` and trailing ``` fences around a JSON payload
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$')
+_IMPACT_KEYWORD_RE = re.compile(r'impact|tác động|ảnh hưởng|affect', re.IGNORECASE)
+
 
 class SummarizationService:
     """Service for summarizing news articles."""
+
+    # Constant parts of the prompts, built once; only the article content varies per call
+    _PROMPT_PREFIX = (
+        "Bạn là chuyên gia phân tích tài chính. Hãy phân tích bài viết tin tức sau "
+        "về thị trường chứng khoán Việt Nam:\n\n"
+    )
+    _PROMPT_SUFFIX = """
+
+Hãy trả lời theo định dạng JSON sau:
+{
+    "summary": "Tóm tắt ngắn gọn 2-3 câu về nội dung chính",
+    "sentiment": "positive/negative/neutral",
+    "impact_assessment": "Đánh giá tác động đến thị trường/cổ phiếu liên quan",
+    "key_points": ["Điểm chính 1", "Điểm chính 2", "Điểm chính 3"]
+}
+
+Lưu ý:
+- Sentiment: positive (tích cực), negative (tiêu cực), neutral (trung lập)
+- Impact assessment: Phân tích cụ thể tác động đến giá cổ phiếu, xu hướng thị trường
+- Key points: Các điểm quan trọng nhất trong bài viết
+"""
+    _BATCH_PROMPT_SUFFIX = """
+
+Hãy trả lời bằng một mảng JSON, mỗi phần tử tương ứng một bài viết theo định dạng sau:
+[
+    {
+        "id": <id của bài viết>,
+        "summary": "Tóm tắt ngắn gọn 2-3 câu về nội dung chính",
+        "sentiment": "positive/negative/neutral",
+        "impact_assessment": "Đánh giá tác động đến thị trường/cổ phiếu liên quan",
+        "key_points": ["Điểm chính 1", "Điểm chính 2", "Điểm chính 3"]
+    }
+]
+
+Lưu ý:
+- Sentiment: positive (tích cực), negative (tiêu cực), neutral (trung lập)
+- Impact assessment: Phân tích cụ thể tác động đến giá cổ phiếu, xu hướng thị trường
+- Key points: Các điểm quan trọng nhất trong bài viết
+"""
     
     def __init__(self, llm_provider: LLMProvider):
         """
@@ -19,37 +71,46 @@ class SummarizationService:
             llm_provider: LLM provider for generating summaries
         """
         self.llm_provider = llm_provider
+        # LRU of summaries keyed by content hash, plus in-flight requests for coalescing
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._single_flight = SingleFlight()
         logger.info("Initialized SummarizationService")
 
     async def summarize(self, content: str) -> Dict[str, Any]:
         """
         Summarize news content and extract sentiment.
         
+        Identical content is served from an in-process LRU cache, and concurrent
+        requests for the same content share a single LLM call.
+        
         Args:
             content: News article content
             
         Returns:
             Dictionary with summary, sentiment, impact_assessment, and key_points
         """
-        logger.info(f"Summarizing content: {len(content)} characters")
-        
-        prompt = f"""Bạn là chuyên gia phân tích tài chính. Hãy phân tích bài viết tin tức sau về thị trường chứng khoán Việt Nam:
+        key = self._cache_key(content)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.debug("Summary cache hit")
+            return cached
 
-{content}
+        result = await self._single_flight.do(
+            key, lambda: self._summarize_and_cache(key, content)
+        )
+        return copy.deepcopy(result)
 
-Hãy trả lời theo định dạng JSON sau:
-{{
-    "summary": "Tóm tắt ngắn gọn 2-3 câu về nội dung chính",
-    "sentiment": "positive/negative/neutral",
-    "impact_assessment": "Đánh giá tác động đến thị trường/cổ phiếu liên quan",
-    "key_points": ["Điểm chính 1", "Điểm chính 2", "Điểm chính 3"]
-}}
+    async def _summarize_and_cache(self, key: str, content: str) -> Dict[str, Any]:
+        """Summarize content and store the result in the cache."""
+        result = await self._summarize_uncached(content)
+        self._cache_put(key, result)
+        return result
 
-Lưu ý:
-- Sentiment: positive (tích cực), negative (tiêu cực), neutral (trung lập)
-- Impact assessment: Phân tích cụ thể tác động đến giá cổ phiếu, xu hướng thị trường
-- Key points: Các điểm quan trọng nhất trong bài viết
-"""
+    async def _summarize_uncached(self, content: str) -> Dict[str, Any]:
+        """Summarize news content with one LLM call (no caching)."""
+        logger.info(f"Summarizing content: {len(content)} characters")
+        
+        prompt = self._PROMPT_PREFIX + content + self._PROMPT_SUFFIX
 
         try:
             response = await self.llm_provider.generate(prompt)
@@ -63,6 +124,127 @@ Lưu ý:
             logger.error(f"Error summarizing content: {str(e)}")
             raise
 
+    async def summarize_batch(self, contents: List[str]) -> List[Dict[str, Any]]:
+        """
+        Summarize several news articles with one LLM call per group of articles.
+        
+        Articles are grouped by SUMMARY_BATCH_SIZE; each group is sent as a single
+        prompt asking for a JSON array, and groups run concurrently. Articles
+        missing from (or unparseable in) a batch response fall back to summarize().
+        
+        Args:
+            contents: News article contents
+            
+        Returns:
+            Summary dictionaries in the same order as contents
+        """
+        logger.info(f"Summarizing batch of {len(contents)} articles")
+        keys = [self._cache_key(content) for content in contents]
+        results: Dict[int, Dict[str, Any]] = {}
+        pending: List[int] = []
+        for index, key in enumerate(keys):
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append(index)
+
+        groups = [
+            pending[start:start + SUMMARY_BATCH_SIZE]
+            for start in range(0, len(pending), SUMMARY_BATCH_SIZE)
+        ]
+        group_results = await asyncio.gather(
+            *(self._summarize_group([contents[index] for index in group]) for group in groups)
+        )
+        for group, summaries in zip(groups, group_results):
+            for index, summary in zip(group, summaries):
+                self._cache_put(keys[index], summary)
+                results[index] = copy.deepcopy(summary)
+
+        return [results[index] for index in range(len(contents))]
+
+    async def _summarize_group(self, contents: List[str]) -> List[Dict[str, Any]]:
+        """Summarize one group of articles in a single LLM call."""
+        if len(contents) == 1:
+            return [await self.summarize(contents[0])]
+
+        articles = "\n\n".join(
+            f"### Bài viết id={index}\n{content}" for index, content in enumerate(contents)
+        )
+        prompt = (
+            f"Bạn là chuyên gia phân tích tài chính. Hãy phân tích {len(contents)} bài viết "
+            "tin tức sau về thị trường chứng khoán Việt Nam:\n\n"
+            + articles
+            + self._BATCH_PROMPT_SUFFIX
+        )
+
+        response = await self.llm_provider.generate(prompt)
+        logger.debug("Received batch summarization response")
+
+        results: Dict[int, Dict[str, Any]] = {}
+        try:
+            items = orjson.loads(self._strip_code_fence(response))
+            if isinstance(items, list):
+                for item in items:
+                    if isinstance(item, dict) and isinstance(item.get("id"), int):
+                        results[item.pop("id")] = self._normalize_summary(item)
+        except orjson.JSONDecodeError:
+            logger.warning("Failed to parse JSON array from batch summary response, summarizing individually")
+
+        missing = [index for index in range(len(contents)) if index not in results]
+        if missing:
+            logger.info(f"Falling back to single summarization for {len(missing)} articles")
+            fallbacks = await asyncio.gather(*(self.summarize(contents[index]) for index in missing))
+            results.update(zip(missing, fallbacks))
+
+        return [results[index] for index in range(len(contents))]
+
+    @staticmethod
+    def _cache_key(content: str) -> str:
+        """Build a compact cache key from the content hash."""
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached summary, refreshing its LRU position."""
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        self._cache.move_to_end(key)
+        return copy.deepcopy(cached)
+
+    def _cache_put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a summary, evicting the least recently used entry when full."""
+        self._cache[key] = copy.deepcopy(result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > SUMMARY_CACHE_MAX_SIZE:
+            self._cache.popitem(last=False)
+
+    def _strip_code_fence(self, response: str) -> str:
+        """Remove markdown code blocks around a JSON payload if present."""
+        return _FENCE_RE.sub("", response).strip()
+
+    def _normalize_summary(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill missing summary fields with defaults and normalize sentiment."""
+        if "summary" not in result:
+            result["summary"] = "Không thể tạo tóm tắt"
+        if "sentiment" not in result:
+            result["sentiment"] = "neutral"
+        if "impact_assessment" not in result:
+            result["impact_assessment"] = "Chưa có đánh giá tác động"
+        if "key_points" not in result:
+            result["key_points"] = []
+
+        # Normalize sentiment value
+        sentiment = str(result["sentiment"])
+        if _POSITIVE_SENTIMENT_RE.search(sentiment):
+            result["sentiment"] = "positive"
+        elif _NEGATIVE_SENTIMENT_RE.search(sentiment):
+            result["sentiment"] = "negative"
+        else:
+            result["sentiment"] = "neutral"
+
+        return result
+
     def _parse_summary_response(self, response: str) -> Dict[str, Any]:
         """
         Parse summary response from LLM.
@@ -74,71 +256,47 @@ Lưu ý:
             Parsed summary dictionary
         """
         try:
-            # Try to parse JSON response
-            # Remove markdown code blocks if present
-            json_str = response.strip()
-            if json_str.startswith("```json"):
-                json_str = json_str[7:]
-            if json_str.startswith("```"):
-                json_str = json_str[3:]
-            if json_str.endswith("```"):
-                json_str = json_str[:-3]
-            json_str = json_str.strip()
-
-            result = json.loads(json_str)
-
-            # Validate required fields
-            if "summary" not in result:
-                result["summary"] = "Không thể tạo tóm tắt"
-            if "sentiment" not in result:
-                result["sentiment"] = "neutral"
-            if "impact_assessment" not in result:
-                result["impact_assessment"] = "Chưa có đánh giá tác động"
-            if "key_points" not in result:
-                result["key_points"] = []
-
-            # Normalize sentiment value
-            sentiment_lower = result["sentiment"].lower()
-            if "positive" in sentiment_lower or "tích cực" in sentiment_lower:
-                result["sentiment"] = "positive"
-            elif "negative" in sentiment_lower or "tiêu cực" in sentiment_lower:
-                result["sentiment"] = "negative"
-            else:
-                result["sentiment"] = "neutral"
-
-            return result
+            # Try to parse JSON response (markdown code blocks removed if present)
+            result = orjson.loads(self._strip_code_fence(response))
+            return self._normalize_summary(result)
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning("Failed to parse JSON from summary response, using fallback parsing")
-            # Fallback to simple parsing if JSON parsing fails
-            summary = self._extract_summary(response)
-            sentiment = extract_sentiment(response)
-            impact = self._extract_impact(response)
-
-            return {
-                "summary": summary,
-                "sentiment": sentiment,
-                "impact_assessment": impact,
-                "key_points": []
-            }
-
-    def _extract_summary(self, text: str) -> str:
-        """Extract summary from unstructured text."""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        if lines:
-            # Return first non-empty line as summary
-            return lines[0][:500]  # Limit to 500 chars
-        return "Không thể tạo tóm tắt"
-
-    def _extract_impact(self, text: str) -> str:
-        """Extract impact assessment from unstructured text."""
-        # Look for impact-related sentences
-        sentences = text.split('.')
-        for sentence in sentences:
-            if any(
-                keyword in sentence.lower() 
-                for keyword in ["impact", "tác động", "ảnh hưởng", "affect"]
-            ):
-                return sentence.strip()
-
-        return "Chưa có đánh giá tác động cụ thể"
+            return self._fallback_parse(response)
+
+    @staticmethod
+    def _fallback_parse(text: str) -> Dict[str, Any]:
+        """
+        Extract summary, sentiment and impact from unstructured text.
+        
+        The summary is the first non-empty line (found without splitting the
+        whole response), sentiment comes from one keyword scan and the impact
+        assessment is the sentence around the first impact-related keyword.
+        
+        Args:
+            text: Unstructured LLM response
+            
+        Returns:
+            Summary dictionary with empty key points
+        """
+        stripped = text.lstrip()
+        if stripped:
+            line_end = stripped.find('\n')
+            first_line = stripped if line_end == -1 else stripped[:line_end]
+            summary = first_line.strip()[:500]  # Limit to 500 chars
+        else:
+            summary = "Không thể tạo tóm tắt"
+
+        impact = "Chưa có đánh giá tác động cụ thể"
+        match = _IMPACT_KEYWORD_RE.search(text)
+        if match:
+            start = text.rfind('.', 0, match.start()) + 1
+            end = text.find('.', match.end())
+            impact = text[start:end if end != -1 else len(text)].strip()
+
+        return {
+            "summary": summary,
+            "sentiment": extract_sentiment(text),
+            "impact_assessment": impact,
+            "key_points": []
+        }
@@ -1,4 +1,5 @@
 """Use case for summarizing news articles."""
+from typing import List
 from src.application.services.summarization_service import SummarizationService
 from src.shared.logging import get_logger
 
@@ -30,3 +31,16 @@ class SummarizeNewsUseCase:
         """
         logger.info(f"Executing news summarization: {len(news_content)} characters")
         return await self.summarization_service.summarize(news_content)
+
+    async def execute_many(self, news_contents: List[str]) -> List[dict]:
+        """
+        Execute news summarization for several articles using batched LLM calls.
+        
+        Args:
+            news_contents: News article contents
+            
+        Returns:
+            Summary dictionaries in the same order as news_contents
+        """
+        logger.info(f"Executing batch news summarization: {len(news_contents)} articles")
+        return await self.summarization_service.summarize_batch(news_contents)
@@ -1,5 +1,6 @@
 """Embedding provider interface for text embeddings."""
 from abc import ABC, abstractmethod
+import numpy as np
 
 
 class EmbeddingProvider(ABC):
@@ -17,3 +18,50 @@ class EmbeddingProvider(ABC):
             Embedding vector as list of floats
         """
         pass
+
+    async def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for a batch of texts.
+        
+        Providers that can encode several inputs in one call should override
+        this; the default falls back to one generate_embedding call per text.
+        
+        Args:
+            texts: Input texts to generate embeddings for
+            
+        Returns:
+            Embedding vectors in the same order as texts
+        """
+        return [await self.generate_embedding(text) for text in texts]
+
+    async def generate_embedding_np(self, text: str) -> np.ndarray:
+        """
+        Generate embedding for the given text as a float32 NumPy array.
+        
+        Providers that produce arrays natively should override this to skip
+        the list round-trip; the default converts generate_embedding's result.
+        
+        Args:
+            text: Input text to generate embedding for
+            
+        Returns:
+            1-D float32 embedding vector
+        """
+        return np.asarray(await self.generate_embedding(text), dtype=np.float32)
+
+    async def generate_embeddings_np(self, texts: list[str]) -> np.ndarray:
+        """
+        Generate embeddings for a batch of texts as one float32 NumPy array.
+        
+        Providers that produce arrays natively should override this; the
+        default converts generate_embeddings' result.
+        
+        Args:
+            texts: Input texts to generate embeddings for
+            
+        Returns:
+            Array of shape (len(texts), dimension), rows in the same order as texts
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.asarray(await self.generate_embeddings(texts), dtype=np.float32)
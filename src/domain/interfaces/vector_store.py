@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Union
+import numpy as np
 
 
 class VectorStore(ABC):
@@ -38,9 +39,9 @@ class VectorStore(ABC):
         document_id: str,
         source: str,
         payloads: List[Dict[str, Any]],
-        vectors: List[List[float]]
+        vectors: Union[np.ndarray, List[List[float]]]
     ) -> None:
-        """Upsert chunk payloads + vectors into the collection."""
+        """Upsert chunk payloads + vectors (float32 array of shape (N, D) or lists) into the collection."""
         pass
 
     @abstractmethod
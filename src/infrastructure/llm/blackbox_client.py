@@ -1,11 +1,12 @@
 """Blackbox AI client implementation for LLM provider."""
 import random
-from typing import Optional
-from openai import OpenAI
+from typing import Optional, Any
+from openai import AsyncOpenAI
 from src.domain.interfaces.llm_provider import LLMProvider
+from src.infrastructure.llm.http_client import get_http_client
 from src.shared.config import get_settings
 from src.shared.exceptions import LLMQuotaExceededError, LLMProviderError
-from src.shared.constants import AVAILABLE_BLACKBOX_MODELS, QUOTA_ERROR_PATTERNS
+from src.shared.constants import AVAILABLE_BLACKBOX_MODELS, QUOTA_ERROR_RE
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -27,10 +28,12 @@ class BlackboxClient(LLMProvider):
         if not api_key:
             raise ValueError("BLACKBOX_API_KEY environment variable is not set")
         
-        # Initialize OpenAI client with Blackbox API
-        self.client = OpenAI(
+        # Initialize async OpenAI client with Blackbox API (does not block the event loop),
+        # reusing the shared connection pool
+        self.client = AsyncOpenAI(
             api_key=api_key,
-            base_url="https://api.blackbox.ai"
+            base_url="https://api.blackbox.ai",
+            http_client=get_http_client()
         )
         
         # Use specified model or pick a random one from available models
@@ -38,13 +41,9 @@ class BlackboxClient(LLMProvider):
             if model_name not in AVAILABLE_BLACKBOX_MODELS:
                 logger.warning(f"Model {model_name} not in available models, using default")
                 model_name = AVAILABLE_BLACKBOX_MODELS[0]
-            self.model_name = model_name
         else:
-            self.model_name = random.choice(AVAILABLE_BLACKBOX_MODELS)
-        
-        self.current_model_index = AVAILABLE_BLACKBOX_MODELS.index(
-            self.model_name
-        ) if self.model_name in AVAILABLE_BLACKBOX_MODELS else 0
+            model_name = random.choice(AVAILABLE_BLACKBOX_MODELS)
+        self._set_model(model_name)
         
         self.temperature = settings.llm_temperature
         self.max_tokens = settings.llm_max_tokens
@@ -66,85 +65,39 @@ class BlackboxClient(LLMProvider):
             LLMProviderError: For other LLM provider errors
         """
         last_error = None
-        models_tried = [self.model_name]
         
         # Try current model first
         try:
             logger.debug(f"Generating with model: {self.model_name}")
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
-            )
-            content = response.choices[0].message.content
+            content = await self._complete(self.model_name, prompt)
             logger.debug(f"Successfully generated response with model: {self.model_name}")
             return content
         except Exception as e:
             last_error = e
-            error_str = str(e)
-            logger.warning(f"Error with model {self.model_name}: {error_str}")
-            
-            # Check if it's a quota error
-            is_quota_error = any(
-                pattern.lower() in error_str.lower() 
-                for pattern in QUOTA_ERROR_PATTERNS
-            )
+            logger.warning(f"Error with model {self.model_name}: {str(e)}")
             
-            if not is_quota_error:
+            if not _is_quota_error(e):
                 # Not a quota error, raise immediately
-                logger.error(f"Non-quota error with {self.model_name}: {error_str}")
+                logger.error(f"Non-quota error with {self.model_name}: {str(e)}")
                 raise LLMProviderError(f"Error generating content with {self.model_name}: {str(e)}") from e
         
-        # If quota exceeded, try other models
-        available_indices = [
-            i for i in range(len(AVAILABLE_BLACKBOX_MODELS))
-            if AVAILABLE_BLACKBOX_MODELS[i] not in models_tried
-        ]
-        
-        if not available_indices:
-            # All models tried, raise original error
-            logger.error("All models exhausted. No available models to try.")
-            raise LLMQuotaExceededError(
-                f"All models quota exceeded. Last error: {str(last_error)}"
-            ) from last_error
-        
-        # Try remaining models in order
-        for idx in available_indices:
+        # If quota exceeded, try the other models in their precomputed order
+        for model_name in self._fallback_order:
             try:
-                model_name = AVAILABLE_BLACKBOX_MODELS[idx]
                 logger.info(f"Trying fallback model: {model_name}")
-                response = self.client.chat.completions.create(
-                    model=model_name,
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens
-                )
+                content = await self._complete(model_name, prompt)
                 # Update current model if successful
-                self.model_name = model_name
-                self.current_model_index = idx
-                content = response.choices[0].message.content
+                self._set_model(model_name)
                 logger.info(f"Successfully generated with fallback model: {model_name}")
                 return content
             except Exception as e:
-                error_str = str(e)
-                is_quota_error = any(
-                    pattern.lower() in error_str.lower()
-                    for pattern in QUOTA_ERROR_PATTERNS
-                )
-                
-                if not is_quota_error:
+                if not _is_quota_error(e):
                     # Not a quota error, raise immediately
-                    logger.error(f"Non-quota error with {model_name}: {error_str}")
+                    logger.error(f"Non-quota error with {model_name}: {str(e)}")
                     raise LLMProviderError(
                         f"Error generating content with {model_name}: {str(e)}"
                     ) from e
                 
-                models_tried.append(model_name)
                 last_error = e
                 logger.warning(f"Quota exceeded for model {model_name}, trying next")
         
@@ -153,9 +106,38 @@ class BlackboxClient(LLMProvider):
         raise LLMQuotaExceededError(
             f"All models quota exceeded. Last error: {str(last_error)}"
         ) from last_error
-    
+
     def rotate_model(self) -> None:
         """Rotate to next available model."""
-        self.current_model_index = (self.current_model_index + 1) % len(AVAILABLE_BLACKBOX_MODELS)
-        self.model_name = AVAILABLE_BLACKBOX_MODELS[self.current_model_index]
+        next_index = (self.current_model_index + 1) % len(AVAILABLE_BLACKBOX_MODELS)
+        self._set_model(AVAILABLE_BLACKBOX_MODELS[next_index])
         logger.info(f"Rotated to model: {self.model_name}")
+
+    def _set_model(self, model_name: str) -> None:
+        """Switch the current model and precompute the quota fallback order."""
+        self.model_name = model_name
+        self.current_model_index = AVAILABLE_BLACKBOX_MODELS.index(model_name)
+        self._fallback_order = tuple(
+            model for model in AVAILABLE_BLACKBOX_MODELS if model != model_name
+        )
+
+    async def _create(self, model_name: str, prompt: str) -> Any:
+        """Send a single-message chat completion request to the given model."""
+        return await self.client.chat.completions.create(
+            model=model_name,
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            temperature=self.temperature,
+            max_tokens=self.max_tokens
+        )
+
+    async def _complete(self, model_name: str, prompt: str) -> str:
+        """Return the completion text from the given model."""
+        response = await self._create(model_name, prompt)
+        return response.choices[0].message.content
+
+
+def _is_quota_error(error: Exception) -> bool:
+    """Check whether an error message matches a known quota/rate-limit pattern."""
+    return QUOTA_ERROR_RE.search(str(error)) is not None
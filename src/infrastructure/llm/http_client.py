@@ -0,0 +1,52 @@
+"""Shared pooled HTTP client for LLM provider SDKs."""
+from typing import Optional
+import httpx
+from src.shared.constants import (
+    LLM_HTTP_MAX_CONNECTIONS,
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_HTTP_TIMEOUT_SECONDS
+)
+from src.shared.logging import get_logger
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx; installed with httpx[http2])
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide async HTTP client shared by all LLM clients.
+    
+    Reusing one connection pool keeps TLS sessions alive across requests and,
+    when h2 is installed, multiplexes concurrent calls over HTTP/2.
+    
+    Returns:
+        Shared httpx.AsyncClient (recreated if it was closed)
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=LLM_HTTP_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS
+            )
+        )
+        logger.info(f"Created shared LLM HTTP client (http2={_HTTP2_AVAILABLE})")
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+        logger.info("Closed shared LLM HTTP client")
+    _http_client = None
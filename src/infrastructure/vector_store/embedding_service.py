@@ -1,47 +1,126 @@
 """Embedding service for generating text embeddings."""
 from typing import Optional
+import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 import asyncio
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from src.domain.interfaces.embedding_provider import EmbeddingProvider
 from src.shared.config import get_settings
 from src.shared.exceptions import EmbeddingServiceError
-from src.shared.constants import DEFAULT_EMBEDDING_MODEL
+from src.shared.constants import (
+    DEFAULT_EMBEDDING_MODEL,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_MAX_WORKERS,
+    EMBEDDING_PRECISION_FP32,
+    EMBEDDING_PRECISION_FP16,
+    EMBEDDING_PRECISION_BF16,
+    EMBEDDING_PRECISION_INT8,
+    ONNX_INT8_MODEL_FILE
+)
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Encodes run on their own small pool so they neither starve nor get starved by
+# other blocking work on the event loop's default executor
+_EMBED_EXECUTOR = ThreadPoolExecutor(
+    max_workers=EMBEDDING_MAX_WORKERS,
+    thread_name_prefix="embed"
+)
+
+
+@lru_cache(maxsize=4)
+def _load_st_model(
+    model_name: str,
+    precision: str = EMBEDDING_PRECISION_FP32
+) -> SentenceTransformer:
+    """Load a SentenceTransformer once per (model, precision) and share it across instances.
+
+    The int8 precision loads the model's dynamically quantized ONNX export through
+    ONNX Runtime (requires sentence-transformers[onnx]). fp16 casts the weights to
+    half precision on CUDA; bf16 casts them to bfloat16 on CUDA or on CPUs with
+    native BF16 support. Whenever a precision is unavailable the FP32 PyTorch
+    model is used instead.
+    """
+    logger.info(f"Loading embedding model: {model_name} ({precision})")
+    if precision == EMBEDDING_PRECISION_INT8:
+        try:
+            model = SentenceTransformer(
+                model_name,
+                backend="onnx",
+                model_kwargs={"file_name": ONNX_INT8_MODEL_FILE}
+            )
+            logger.info(f"Embedding model {model_name} loaded successfully (ONNX int8)")
+            return model
+        except Exception as e:
+            logger.warning(
+                f"Failed to load int8 ONNX model for {model_name}, falling back to fp32: {str(e)}"
+            )
+    model = SentenceTransformer(model_name)
+    if precision == EMBEDDING_PRECISION_FP16 and torch.cuda.is_available():
+        model = model.half()
+    elif precision == EMBEDDING_PRECISION_BF16 and _bf16_supported():
+        model = model.to(dtype=torch.bfloat16)
+    elif precision in (EMBEDDING_PRECISION_FP16, EMBEDDING_PRECISION_BF16):
+        logger.warning(f"{precision} is not supported on this device, using fp32 for {model_name}")
+    logger.info(f"Embedding model {model_name} loaded successfully")
+    return model
+
+
+def _bf16_supported() -> bool:
+    """Check whether bfloat16 inference is natively supported on this machine."""
+    if torch.cuda.is_available():
+        return torch.cuda.is_bf16_supported()
+    try:
+        # oneDNN exposes native BF16 kernels only on CPUs with AVX512-BF16/AMX
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except (AttributeError, RuntimeError):
+        return False
+
+
+def _encode(model: SentenceTransformer, texts: list[str], batch_size: int) -> np.ndarray:
+    """Encode texts without autograd bookkeeping (runs in the encode pool)."""
+    with torch.inference_mode():
+        return model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+
 
 class EmbeddingService(EmbeddingProvider):
     """Service for generating text embeddings using sentence transformers."""
     
-    def __init__(self, model_name: Optional[str] = None):
+    def __init__(self, model_name: Optional[str] = None, precision: Optional[str] = None):
         """
         Initialize embedding service.
         
         Args:
             model_name: Name of the sentence transformer model to use.
                        If None, uses default from configuration.
+            precision: Inference precision ("fp32", "fp16", "bf16" or "int8").
+                       If None, uses default from configuration.
         """
         settings = get_settings()
         self.model_name = model_name or settings.embedding_model_name or DEFAULT_EMBEDDING_MODEL
-        self._model: Optional[SentenceTransformer] = None
-        logger.info(f"Initialized EmbeddingService with model: {self.model_name}")
+        self.precision = precision or settings.embedding_precision or EMBEDDING_PRECISION_FP32
+        logger.info(
+            f"Initialized EmbeddingService with model: {self.model_name} ({self.precision})"
+        )
 
     @property
     def model(self) -> SentenceTransformer:
-        """Lazy load the embedding model."""
-        if self._model is None:
-            try:
-                logger.info(f"Loading embedding model: {self.model_name}")
-                self._model = SentenceTransformer(self.model_name)
-                logger.info(f"Embedding model {self.model_name} loaded successfully")
-            except Exception as e:
-                logger.error(f"Failed to load embedding model {self.model_name}: {str(e)}")
-                raise EmbeddingServiceError(
-                    f"Failed to load embedding model: {str(e)}"
-                ) from e
-        return self._model
+        """Lazy load the embedding model (shared by all instances using the same model)."""
+        try:
+            return _load_st_model(self.model_name, self.precision)
+        except Exception as e:
+            logger.error(f"Failed to load embedding model {self.model_name}: {str(e)}")
+            raise EmbeddingServiceError(
+                f"Failed to load embedding model: {str(e)}"
+            ) from e
 
     async def generate_embedding(self, text: str) -> list[float]:
         """
@@ -56,24 +135,85 @@ class EmbeddingService(EmbeddingProvider):
         Raises:
             EmbeddingServiceError: If embedding generation fails
         """
+        return (await self.generate_embeddings([text]))[0]
+
+    async def generate_embeddings(
+        self,
+        texts: list[str],
+        batch_size: int = EMBEDDING_BATCH_SIZE
+    ) -> list[list[float]]:
+        """
+        Generate embeddings for a batch of texts with a single encode call.
+        
+        Args:
+            texts: Input texts to generate embeddings for
+            batch_size: Number of texts encoded per forward pass
+            
+        Returns:
+            Embedding vectors in the same order as texts
+            
+        Raises:
+            EmbeddingServiceError: If embedding generation fails
+        """
+        if not texts:
+            return []
+        return (await self.generate_embeddings_np(texts, batch_size=batch_size)).tolist()
+
+    async def generate_embedding_np(self, text: str) -> np.ndarray:
+        """
+        Generate embedding for the given text as a float32 NumPy array.
+        
+        Args:
+            text: Input text to generate embedding for
+            
+        Returns:
+            1-D float32 embedding vector
+            
+        Raises:
+            EmbeddingServiceError: If embedding generation fails
+        """
+        return (await self.generate_embeddings_np([text]))[0]
+
+    async def generate_embeddings_np(
+        self,
+        texts: list[str],
+        batch_size: int = EMBEDDING_BATCH_SIZE
+    ) -> np.ndarray:
+        """
+        Generate embeddings for a batch of texts as one contiguous float32 array.
+        
+        Args:
+            texts: Input texts to generate embeddings for
+            batch_size: Number of texts encoded per forward pass
+            
+        Returns:
+            Array of shape (len(texts), dimension), rows in the same order as texts
+            
+        Raises:
+            EmbeddingServiceError: If embedding generation fails
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
         try:
-            # Run in thread pool to avoid blocking the event loop
-            loop = asyncio.get_event_loop()
-            embedding = await loop.run_in_executor(
-                None,
-                self.model.encode,
-                text
+            # Run in the dedicated encode pool to avoid blocking the event loop
+            embeddings = await asyncio.get_running_loop().run_in_executor(
+                _EMBED_EXECUTOR,
+                partial(_encode, self.model, texts, batch_size)
+            )
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+            logger.debug(
+                f"Generated {embeddings.shape[0]} embeddings of dimension {embeddings.shape[-1]}"
             )
-            embedding_list = embedding.tolist()
-            logger.debug(f"Generated embedding of dimension {len(embedding_list)}")
-            return embedding_list
+            return embeddings
+        except EmbeddingServiceError:
+            raise
         except Exception as e:
-            logger.error(f"Error generating embedding: {str(e)}")
+            logger.error(f"Error generating embeddings: {str(e)}")
             raise EmbeddingServiceError(
                 f"Failed to generate embedding: {str(e)}"
             ) from e
 
     def clear_cache(self) -> None:
-        """Clear the model cache (useful for testing or memory management)."""
-        self._model = None
+        """Clear the shared model cache (useful for testing or memory management)."""
+        _load_st_model.cache_clear()
         logger.debug("Embedding model cache cleared")
@@ -0,0 +1,148 @@
+"""FastEmbed (ONNX Runtime) embedding service for text embeddings."""
+import asyncio
+from typing import Optional, List, Any
+import numpy as np
+from src.domain.interfaces.embedding_provider import EmbeddingProvider
+from src.shared.exceptions import ConfigurationError, EmbeddingServiceError
+from src.shared.constants import DEFAULT_FASTEMBED_MODEL, EMBEDDING_BATCH_SIZE
+from src.shared.logging import get_logger
+
+try:
+    from fastembed import TextEmbedding
+except ImportError:  # fastembed is an optional dependency
+    TextEmbedding = None
+
+logger = get_logger(__name__)
+
+
+class FastEmbedService(EmbeddingProvider):
+    """Service for generating text embeddings with FastEmbed (ONNX Runtime, CPU)."""
+
+    def __init__(self, model_name: Optional[str] = None):
+        """
+        Initialize FastEmbed service.
+
+        Args:
+            model_name: FastEmbed model name. If None, uses DEFAULT_FASTEMBED_MODEL.
+
+        Raises:
+            ConfigurationError: If the fastembed package is not installed
+        """
+        if TextEmbedding is None:
+            raise ConfigurationError(
+                "fastembed is not installed. Install it with 'pip install fastembed' "
+                "or set EMBEDDING_BACKEND=sentence_transformers"
+            )
+        self.model_name = model_name or DEFAULT_FASTEMBED_MODEL
+        self._model: Optional[Any] = None
+        logger.info(f"Initialized FastEmbedService with model: {self.model_name}")
+
+    @property
+    def model(self) -> Any:
+        """Lazy load the ONNX embedding model."""
+        if self._model is None:
+            try:
+                logger.info(f"Loading FastEmbed model: {self.model_name}")
+                self._model = TextEmbedding(model_name=self.model_name)
+                logger.info(f"FastEmbed model {self.model_name} loaded successfully")
+            except Exception as e:
+                logger.error(f"Failed to load FastEmbed model {self.model_name}: {str(e)}")
+                raise EmbeddingServiceError(
+                    f"Failed to load embedding model: {str(e)}"
+                ) from e
+        return self._model
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """Encode texts synchronously into one float32 array (runs in a worker thread)."""
+        return np.asarray(
+            list(self.model.embed(texts, batch_size=EMBEDDING_BATCH_SIZE)),
+            dtype=np.float32
+        )
+
+    async def generate_embedding(self, text: str) -> list[float]:
+        """
+        Generate embedding for the given text.
+
+        Args:
+            text: Input text to generate embedding for
+
+        Returns:
+            Embedding vector as list of floats
+
+        Raises:
+            EmbeddingServiceError: If embedding generation fails
+        """
+        return (await self.generate_embeddings([text]))[0]
+
+    async def generate_embedding_np(self, text: str) -> np.ndarray:
+        """
+        Generate embedding for the given text as a float32 NumPy array.
+
+        Args:
+            text: Input text to generate embedding for
+
+        Returns:
+            1-D float32 embedding vector
+
+        Raises:
+            EmbeddingServiceError: If embedding generation fails
+        """
+        try:
+            vector = await asyncio.to_thread(lambda: next(iter(self.model.embed([text]))))
+            return np.asarray(vector, dtype=np.float32)
+        except EmbeddingServiceError:
+            raise
+        except Exception as e:
+            logger.error(f"Error generating embedding: {str(e)}")
+            raise EmbeddingServiceError(
+                f"Failed to generate embeddings: {str(e)}"
+            ) from e
+
+    async def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for a batch of texts in one ONNX pass.
+
+        Args:
+            texts: Input texts to generate embeddings for
+
+        Returns:
+            Embedding vectors in the same order as texts
+
+        Raises:
+            EmbeddingServiceError: If embedding generation fails
+        """
+        if not texts:
+            return []
+        return (await self.generate_embeddings_np(texts)).tolist()
+
+    async def generate_embeddings_np(self, texts: list[str]) -> np.ndarray:
+        """
+        Generate embeddings for a batch of texts as one float32 NumPy array.
+
+        Args:
+            texts: Input texts to generate embeddings for
+
+        Returns:
+            Array of shape (len(texts), dimension), rows in the same order as texts
+
+        Raises:
+            EmbeddingServiceError: If embedding generation fails
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        try:
+            embeddings = await asyncio.to_thread(self._embed, texts)
+            logger.debug(f"Generated {len(embeddings)} embeddings with FastEmbed")
+            return embeddings
+        except EmbeddingServiceError:
+            raise
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {str(e)}")
+            raise EmbeddingServiceError(
+                f"Failed to generate embeddings: {str(e)}"
+            ) from e
+
+    def clear_cache(self) -> None:
+        """Clear the model cache (useful for testing or memory management)."""
+        self._model = None
+        logger.debug("FastEmbed model cache cleared")
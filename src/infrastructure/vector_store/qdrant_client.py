@@ -1,6 +1,13 @@
 """Qdrant vector store client implementation."""
-from typing import List, Dict, Any, Optional
-from qdrant_client import QdrantClient as Qdrant
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, Union
+import grpc
+import httpx
+import numpy as np
+from numpy.typing import ArrayLike
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http.exceptions import UnexpectedResponse
 from qdrant_client.http.models import (
     Distance,
@@ -8,17 +15,58 @@ from qdrant_client.http.models import (
     Filter,
     FieldCondition,
     MatchValue,
-    PointStruct
+    Batch,
+    HnswConfigDiff,
+    PayloadSchemaType,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType
 )
 from src.domain.interfaces.vector_store import VectorStore
 from src.domain.interfaces.embedding_provider import EmbeddingProvider
 from src.shared.config import get_settings
 from src.shared.exceptions import VectorStoreError
-from src.shared.constants import DEFAULT_QDRANT_COLLECTION_NAME, DEFAULT_EMBEDDING_DIMENSION
+from src.shared.constants import (
+    DEFAULT_QDRANT_COLLECTION_NAME,
+    DEFAULT_EMBEDDING_DIMENSION,
+    UPSERT_BATCH_SIZE,
+    QDRANT_HNSW_M,
+    QDRANT_HNSW_EF_CONSTRUCT,
+    QDRANT_QUANTIZATION_QUANTILE
+)
+from src.shared.single_flight import SingleFlight
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Only these payload keys are fetched, so unused payload data is never transferred or decoded
+_SOURCE_PAYLOAD_FIELDS: List[str] = [
+    "documentId", "source", "sourceUrl", "title", "section", "symbol", "chunkId", "text"
+]
+
+# Search filter name -> payload key
+_FILTER_MAP: Tuple[Tuple[str, str], ...] = (
+    ("document_id", "documentId"),
+    ("source", "source"),
+    ("symbol", "symbol"),
+)
+
+
+def _is_missing_collection(error: Exception) -> bool:
+    """Check whether a Qdrant error means the collection does not exist (REST 404 / gRPC NOT_FOUND)."""
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code == 404
+    if isinstance(error, grpc.RpcError):
+        return error.code() == grpc.StatusCode.NOT_FOUND
+    return False
+
+
+def _normalize_rows(vectors: ArrayLike) -> np.ndarray:
+    """Scale vectors (1-D or row-wise 2-D) to unit L2 norm, leaving zero vectors as-is."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
 
 class QdrantClient(VectorStore):
     """Qdrant vector store client implementing VectorStore interface."""
@@ -29,10 +77,33 @@ class QdrantClient(VectorStore):
         qdrant_url = settings.qdrant_url
         self.collection_name = settings.qdrant_collection_name or DEFAULT_QDRANT_COLLECTION_NAME
         self.embedding_provider = embedding_provider
+        # Collection creation parameters, snapshotted once instead of read per call
+        self._dimension = settings.embedding_dimension or DEFAULT_EMBEDDING_DIMENSION
+        self._quantization_enabled = settings.qdrant_quantization_enabled
+        self._indexed_payload_fields = list(settings.qdrant_indexed_payload_fields)
+        # Set once the collection is known to exist, so upserts skip the probe
+        self._collection_ready = False
+        # LRU of query embeddings keyed by text hash; concurrent misses share one encode
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._query_cache_size = settings.query_embedding_cache_size
+        self._query_flight = SingleFlight()
         
         try:
-            self.client = Qdrant(url=qdrant_url)
-            logger.info(f"Connected to Qdrant at {qdrant_url}")
+            # One pooled client per process: gRPC (HTTP/2 streams) when enabled,
+            # otherwise a REST connection pool sized by qdrant_pool_size
+            self.client = AsyncQdrantClient(
+                url=qdrant_url,
+                prefer_grpc=settings.qdrant_prefer_grpc,
+                grpc_port=settings.qdrant_grpc_port,
+                timeout=settings.qdrant_timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.qdrant_pool_size,
+                    max_keepalive_connections=settings.qdrant_pool_size
+                )
+            )
+            logger.info(
+                f"Connected to Qdrant at {qdrant_url} (grpc={settings.qdrant_prefer_grpc})"
+            )
         except Exception as e:
             logger.error(f"Failed to connect to Qdrant: {str(e)}")
             raise VectorStoreError(f"Failed to connect to Qdrant: {str(e)}") from e
@@ -58,58 +129,21 @@ class QdrantClient(VectorStore):
             VectorStoreError: If search operation fails
         """
         try:
-            # Generate embedding from query text
-            query_vector = await self.embedding_provider.generate_embedding(query_text)
-
-            # Build filter conditions
-            filter_conditions = []
-            if filters:
-                filter_mapping = {
-                    "document_id": "documentId",
-                    "source": "source",
-                    "symbol": "symbol"
-                }
-                for filter_key, payload_key in filter_mapping.items():
-                    value = filters.get(filter_key)
-                    if value is not None:
-                        filter_conditions.append(
-                            FieldCondition(
-                                key=payload_key,
-                                match=MatchValue(value=value)
-                            )
-                        )
-            
-            # Create filter object if conditions exist
-            query_filter = None
-            if filter_conditions:
-                query_filter = Filter(must=filter_conditions)
-            
+            # Embed query text, reusing cached embeddings (float32 array, passed to Qdrant as-is)
+            query_vector = await self._embed_query(query_text)
+
             # Perform search
-            results = self.client.search(
+            results = await self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_vector,
                 limit=top_k,
-                query_filter=query_filter
+                query_filter=self._build_filter(filters),
+                with_payload=_SOURCE_PAYLOAD_FIELDS,
+                with_vectors=False
             )
             
             # Build source objects with metadata and text
-            sources = []
-            for hit in results:
-                payload = hit.payload or {}
-
-                # Build source object (use safe fallbacks)
-                source_obj = {
-                    "documentId": payload.get("documentId", ""),
-                    "source": payload.get("source", ""),
-                    "sourceUrl": payload.get("sourceUrl"),
-                    "title": payload.get("title", "Unknown"),
-                    "section": payload.get("section", ""),
-                    "symbol": payload.get("symbol", ""),
-                    "chunkId": payload.get("chunkId", str(hit.id)),  # Point ID
-                    "score": float(hit.score),
-                    "text": payload.get("text", "")
-                }
-                sources.append(source_obj)
+            sources = [self._to_source(hit) for hit in results]
             
             logger.debug(
                 f"Search returned {len(sources)} results (filters={filters})"
@@ -117,14 +151,65 @@ class QdrantClient(VectorStore):
             
             return sources
             
-        except UnexpectedResponse as e:
-            # Collection might not exist yet
-            logger.warning(f"Collection {self.collection_name} does not exist: {str(e)}")
-            return []
         except Exception as e:
+            if _is_missing_collection(e):
+                # Collection might not exist yet
+                logger.warning(f"Collection {self.collection_name} does not exist: {str(e)}")
+                return []
             logger.error(f"Error searching Qdrant: {str(e)}")
             raise VectorStoreError(f"Search operation failed: {str(e)}") from e
 
+    async def _embed_query(self, query_text: str) -> np.ndarray:
+        """Get the query embedding from the LRU cache, computing it on a miss."""
+        # Whitespace carries no tokens, so queries differing only in spacing share one entry
+        query_text = " ".join(query_text.split())
+        if self._query_cache_size <= 0:
+            return _normalize_rows(await self.embedding_provider.generate_embedding_np(query_text))
+
+        key = hashlib.blake2b(query_text.encode("utf-8"), digest_size=16).hexdigest()
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return cached
+        return await self._query_flight.do(key, lambda: self._embed_and_cache(key, query_text))
+
+    async def _embed_and_cache(self, key: str, query_text: str) -> np.ndarray:
+        """Embed a query and store the (read-only) vector in the LRU cache."""
+        vector = _normalize_rows(await self.embedding_provider.generate_embedding_np(query_text))
+        vector.setflags(write=False)
+        self._query_cache[key] = vector
+        if len(self._query_cache) > self._query_cache_size:
+            self._query_cache.popitem(last=False)
+        return vector
+
+    @staticmethod
+    def _build_filter(filters: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """Build a Qdrant payload filter from search filters (None if no conditions)."""
+        if not filters:
+            return None
+        filter_conditions = [
+            FieldCondition(key=payload_key, match=MatchValue(value=value))
+            for filter_key, payload_key in _FILTER_MAP
+            if (value := filters.get(filter_key)) is not None
+        ]
+        return Filter(must=filter_conditions) if filter_conditions else None
+
+    @staticmethod
+    def _to_source(hit: Any) -> Dict[str, Any]:
+        """Build a source object from a scored point (use safe fallbacks)."""
+        payload = hit.payload or {}
+        return {
+            "documentId": payload.get("documentId", ""),
+            "source": payload.get("source", ""),
+            "sourceUrl": payload.get("sourceUrl"),
+            "title": payload.get("title", "Unknown"),
+            "section": payload.get("section", ""),
+            "symbol": payload.get("symbol", ""),
+            "chunkId": payload.get("chunkId", str(hit.id)),  # Point ID
+            "score": hit.score,  # Already a float in qdrant-client's ScoredPoint
+            "text": payload.get("text", "")
+        }
+
     async def upsert(self, vectors: List[Dict[str, Any]]) -> None:
         """
         Upsert vectors into the collection.
@@ -137,75 +222,147 @@ class QdrantClient(VectorStore):
         """
         try:
             await self.ensure_collection()
-            
+
+            # The collection uses DOT distance, so vectors must be unit-normalized here too
+            if vectors:
+                normalized = _normalize_rows([v["vector"] for v in vectors]).tolist()
+                vectors = [{**v, "vector": row} for v, row in zip(vectors, normalized)]
+
             # Upsert vectors
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=vectors
-            )
+            await self._upsert_batched(vectors)
             logger.debug(f"Upserted {len(vectors)} vectors to {self.collection_name}")
         except Exception as e:
             logger.error(f"Error upserting vectors to Qdrant: {str(e)}")
             raise VectorStoreError(f"Upsert operation failed: {str(e)}") from e
 
     async def ensure_collection(self, vector_size: Optional[int] = None) -> None:
-        """Ensure collection exists with correct vector size."""
-        try:
-            self.client.get_collection(self.collection_name)
+        """Ensure collection exists with correct vector size (checked once per client)."""
+        if self._collection_ready:
             return
-        except UnexpectedResponse:
-            settings = get_settings()
-            dimension = vector_size or settings.embedding_dimension or DEFAULT_EMBEDDING_DIMENSION
-            logger.info(f"Creating collection {self.collection_name} with dimension {dimension}")
-            self.client.create_collection(
-                collection_name=self.collection_name,
-                vectors_config=VectorParams(
-                    size=dimension,
-                    distance=Distance.COSINE
-                )
-            )
-            logger.info(f"Collection {self.collection_name} created successfully")
+        try:
+            try:
+                await self.client.get_collection(self.collection_name)
+            except Exception as e:
+                if not _is_missing_collection(e):
+                    raise
+                await self._create_collection(vector_size or self._dimension)
+            # Idempotent, so collections created before indexing was added get indexed too
+            await self._create_payload_indexes(self._indexed_payload_fields)
+            self._collection_ready = True
         except Exception as e:
             logger.error(f"Error ensuring collection {self.collection_name}: {str(e)}")
             raise VectorStoreError(f"Ensure collection failed: {str(e)}") from e
 
+    async def _create_collection(self, dimension: int) -> None:
+        """Create the collection with quantization and HNSW params."""
+        logger.info(f"Creating collection {self.collection_name} with dimension {dimension}")
+        # int8 scalar quantization keeps a 4x smaller copy of the vectors in RAM
+        quantization_config = None
+        if self._quantization_enabled:
+            quantization_config = ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=QDRANT_QUANTIZATION_QUANTILE,
+                    always_ram=True
+                )
+            )
+        await self.client.create_collection(
+            collection_name=self.collection_name,
+            vectors_config=VectorParams(
+                size=dimension,
+                # Vectors are unit-normalized, so dot product equals cosine similarity
+                distance=Distance.DOT
+            ),
+            hnsw_config=HnswConfigDiff(
+                m=QDRANT_HNSW_M,
+                ef_construct=QDRANT_HNSW_EF_CONSTRUCT
+            ),
+            quantization_config=quantization_config
+        )
+        logger.info(f"Collection {self.collection_name} created successfully")
+
+    async def _create_payload_indexes(self, field_names: List[str]) -> None:
+        """Ensure keyword payload indexes exist so filtered searches use indexed lookups."""
+        results = await asyncio.gather(
+            *(
+                self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=field_name,
+                    field_schema=PayloadSchemaType.KEYWORD
+                )
+                for field_name in field_names
+            ),
+            return_exceptions=True
+        )
+        for field_name, result in zip(field_names, results):
+            if isinstance(result, Exception):
+                # Filtering still works without the index, just slower
+                logger.warning(f"Could not create payload index on {field_name}: {str(result)}")
+            else:
+                logger.debug(f"Ensured payload index on {field_name}")
+
+    def invalidate_collection_cache(self) -> None:
+        """Forget the cached collection check (e.g. after the collection was dropped)."""
+        self._collection_ready = False
+
     async def upsert_chunks(
         self,
         document_id: str,
         source: str,
         payloads: List[Dict[str, Any]],
-        vectors: List[List[float]]
+        vectors: Union[np.ndarray, List[List[float]]]
     ) -> None:
-        """Upsert chunk payloads + vectors into the collection."""
+        """Upsert chunk payloads + vectors (float32 array of shape (N, D) or lists) into the collection."""
         try:
-            if not vectors:
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+            if vectors.size == 0:
                 logger.info(f"No vectors to upsert for document {document_id}")
                 return
+            vectors = _normalize_rows(vectors)
+
+            count = min(len(payloads), len(vectors))
+            ids: List[str] = []
+            for index, payload in enumerate(payloads[:count]):
+                chunk_id = payload.get("chunkId")
+                if not chunk_id:
+                    raise VectorStoreError(
+                        f"Payload {index} for document {document_id} has no chunkId"
+                    )
+                ids.append(chunk_id)
 
-            await self.ensure_collection(vector_size=len(vectors[0]))
+            await self.ensure_collection(vector_size=vectors.shape[1])
 
-            points: List[PointStruct] = []
-            for payload, vector in zip(payloads, vectors):
-                point_id = payload.get("chunkId")
-                points.append(
-                    PointStruct(
-                        id=point_id,
-                        vector=vector,
-                        payload=payload
+            # Column-oriented Batch: one ids/vectors/payloads list per request
+            # instead of a PointStruct per point
+            await asyncio.gather(*(
+                self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=Batch(
+                        ids=ids[start:start + UPSERT_BATCH_SIZE],
+                        # Batch validates list[list[float]]; convert one slice at a time
+                        vectors=vectors[start:start + UPSERT_BATCH_SIZE].tolist(),
+                        payloads=payloads[start:start + UPSERT_BATCH_SIZE]
                     )
                 )
-
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points
-            )
+                for start in range(0, count, UPSERT_BATCH_SIZE)
+            ))
             logger.debug(
-                f"Upserted {len(points)} chunks for document {document_id} to {self.collection_name}"
+                f"Upserted {count} chunks for document {document_id} to {self.collection_name}"
             )
         except Exception as e:
             logger.error(f"Error upserting chunks to Qdrant: {str(e)}")
             raise VectorStoreError(f"Upsert chunks failed: {str(e)}") from e
 
+    async def _upsert_batched(self, points: List[Any]) -> None:
+        """Upsert points in UPSERT_BATCH_SIZE requests sent concurrently."""
+        await asyncio.gather(*(
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=points[start:start + UPSERT_BATCH_SIZE]
+            )
+            for start in range(0, len(points), UPSERT_BATCH_SIZE)
+        ))
+
     async def delete_document(self, document_id: str) -> int:
         """Delete all points for a documentId, return deleted count."""
         try:
@@ -218,14 +375,15 @@ class QdrantClient(VectorStore):
                 ]
             )
 
-            count_result = self.client.count(
+            # Must complete before the delete; a concurrent count could observe the post-delete state
+            count_result = await self.client.count(
                 collection_name=self.collection_name,
                 count_filter=query_filter,
                 exact=True
             )
             deleted_count = int(getattr(count_result, "count", 0) or 0)
 
-            self.client.delete(
+            await self.client.delete(
                 collection_name=self.collection_name,
                 points_selector=query_filter
             )
@@ -233,9 +391,9 @@ class QdrantClient(VectorStore):
                 f"Deleted {deleted_count} points for document {document_id} from {self.collection_name}"
             )
             return deleted_count
-        except UnexpectedResponse as e:
-            logger.warning(f"Collection {self.collection_name} does not exist: {str(e)}")
-            return 0
         except Exception as e:
+            if _is_missing_collection(e):
+                logger.warning(f"Collection {self.collection_name} does not exist: {str(e)}")
+                return 0
             logger.error(f"Error deleting document from Qdrant: {str(e)}")
             raise VectorStoreError(f"Delete document failed: {str(e)}") from e
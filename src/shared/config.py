@@ -1,6 +1,8 @@
 """Centralized configuration management for the AI Service."""
 import os
-from typing import Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
@@ -23,6 +25,18 @@ class Settings(BaseSettings):
         default="stock_documents", 
         env="QDRANT_COLLECTION_NAME"
     )
+    qdrant_prefer_grpc: bool = Field(default=False, env="QDRANT_PREFER_GRPC")
+    qdrant_grpc_port: int = Field(default=6334, env="QDRANT_GRPC_PORT")
+    qdrant_pool_size: int = Field(default=100, env="QDRANT_POOL_SIZE")  # Max pooled HTTP connections
+    qdrant_timeout: int = Field(default=60, env="QDRANT_TIMEOUT")  # Seconds
+    qdrant_quantization_enabled: bool = Field(
+        default=True,
+        env="QDRANT_QUANTIZATION_ENABLED"
+    )  # int8 scalar quantization for newly created collections
+    qdrant_indexed_payload_fields: list[str] = Field(
+        default=["documentId", "source", "symbol"],
+        env="QDRANT_INDEXED_PAYLOAD_FIELDS"
+    )  # Keyword payload indexes created with the collection (search filter keys)
     
     # Message Queue Configuration (optional)
     rabbitmq_connection_string: Optional[str] = Field(
@@ -44,6 +58,18 @@ class Settings(BaseSettings):
         env="EMBEDDING_MODEL_NAME"
     )
     embedding_dimension: int = Field(default=384, env="EMBEDDING_DIMENSION")
+    query_embedding_cache_size: int = Field(
+        default=4096,
+        env="QUERY_EMBEDDING_CACHE_SIZE"
+    )  # LRU entries for search query embeddings (0 disables)
+    embedding_backend: str = Field(
+        default="sentence_transformers",
+        env="EMBEDDING_BACKEND"
+    )  # sentence_transformers or fastembed
+    embedding_precision: str = Field(
+        default="fp32",
+        env="EMBEDDING_PRECISION"
+    )  # fp32, fp16, bf16 or int8 (ONNX); sentence_transformers backend only
     
     # CORS Configuration
     cors_origins: list[str] = Field(
@@ -81,6 +107,24 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of {valid_levels}")
         return v.upper()
     
+    @field_validator("embedding_backend")
+    @classmethod
+    def validate_embedding_backend(cls, v):
+        """Validate embedding backend."""
+        valid_backends = ["sentence_transformers", "fastembed"]
+        if v.lower() not in valid_backends:
+            raise ValueError(f"Embedding backend must be one of {valid_backends}")
+        return v.lower()
+    
+    @field_validator("embedding_precision")
+    @classmethod
+    def validate_embedding_precision(cls, v):
+        """Validate embedding precision."""
+        valid_precisions = ["fp32", "fp16", "bf16", "int8"]
+        if v.lower() not in valid_precisions:
+            raise ValueError(f"Embedding precision must be one of {valid_precisions}")
+        return v.lower()
+    
     @field_validator("llm_temperature")
     @classmethod
     def validate_temperature(cls, v):
@@ -96,13 +140,47 @@ class Settings(BaseSettings):
         extra = "ignore"  # Ignore extra fields from .env that are not in this model
 
 
-# Singleton instance
-_settings: Optional[Settings] = None
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Frozen, validated application settings (see Settings for field docs).
+    
+    An immutable snapshot built once from Settings: plain slotted attribute
+    reads instead of pydantic model access on every get_settings().<field>
+    in request paths. List settings are stored as tuples so the snapshot is
+    hashable.
+    """
+    
+    blackbox_api_key: Optional[str]
+    api_title: str
+    api_version: str
+    qdrant_url: str
+    qdrant_collection_name: str
+    qdrant_prefer_grpc: bool
+    qdrant_grpc_port: int
+    qdrant_pool_size: int
+    qdrant_timeout: int
+    qdrant_quantization_enabled: bool
+    qdrant_indexed_payload_fields: Tuple[str, ...]
+    rabbitmq_connection_string: Optional[str]
+    default_llm_model: str
+    llm_temperature: float
+    llm_max_tokens: int
+    embedding_model_name: str
+    embedding_dimension: int
+    query_embedding_cache_size: int
+    embedding_backend: str
+    embedding_precision: str
+    cors_origins: Tuple[str, ...]
+    log_level: str
+    log_format: str
+    internal_api_key: Optional[str]
 
 
-def get_settings() -> Settings:
-    """Get the application settings singleton."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+@lru_cache()
+def get_settings() -> Config:
+    """Get the application settings singleton (validated once, then frozen)."""
+    values = Settings().model_dump()
+    values["qdrant_indexed_payload_fields"] = tuple(values["qdrant_indexed_payload_fields"])
+    values["cors_origins"] = tuple(values["cors_origins"])
+    return Config(**values)
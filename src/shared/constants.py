@@ -1,4 +1,13 @@
 """Constants used throughout the AI Service."""
+import re
+from typing import Iterable, Pattern
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> Pattern[str]:
+    """Compile keywords into one case-insensitive alternation, longest first."""
+    ordered = sorted(keywords, key=lambda word: (-len(word), word))
+    return re.compile("|".join(map(re.escape, ordered)), re.IGNORECASE)
+
 
 # LLM Model Configuration
 AVAILABLE_BLACKBOX_MODELS = [
@@ -11,10 +20,48 @@ AVAILABLE_BLACKBOX_MODELS = [
 DEFAULT_LLM_TEMPERATURE = 0.7
 DEFAULT_LLM_MAX_TOKENS = 2048
 
+# Shared LLM HTTP connection pool
+LLM_HTTP_MAX_CONNECTIONS = 100
+LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+LLM_HTTP_TIMEOUT_SECONDS = 60.0
+
 # Vector Store Configuration
 DEFAULT_QDRANT_COLLECTION_NAME = "stock_documents"
 DEFAULT_EMBEDDING_DIMENSION = 384
 DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+UPSERT_BATCH_SIZE = 256  # Points per Qdrant upsert request
+QDRANT_HNSW_M = 16
+QDRANT_HNSW_EF_CONSTRUCT = 128
+QDRANT_QUANTIZATION_QUANTILE = 0.99
+EMBEDDING_BATCH_SIZE = 64  # Texts per encode forward pass
+EMBEDDING_MAX_WORKERS = 2  # Dedicated encode threads (each encode already uses intra-op threads)
+
+# Embedding inference precision
+EMBEDDING_PRECISION_FP32 = "fp32"
+EMBEDDING_PRECISION_FP16 = "fp16"  # Half-precision weights, CUDA only
+EMBEDDING_PRECISION_BF16 = "bf16"  # bfloat16 weights (CUDA or CPUs with BF16/AMX support)
+EMBEDDING_PRECISION_INT8 = "int8"  # Dynamically quantized ONNX export
+AVAILABLE_EMBEDDING_PRECISIONS = [
+    EMBEDDING_PRECISION_FP32,
+    EMBEDDING_PRECISION_FP16,
+    EMBEDDING_PRECISION_BF16,
+    EMBEDDING_PRECISION_INT8,
+]
+ONNX_INT8_MODEL_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Embedding backends
+EMBEDDING_BACKEND_SENTENCE_TRANSFORMERS = "sentence_transformers"
+EMBEDDING_BACKEND_FASTEMBED = "fastembed"
+AVAILABLE_EMBEDDING_BACKENDS = [
+    EMBEDDING_BACKEND_SENTENCE_TRANSFORMERS,
+    EMBEDDING_BACKEND_FASTEMBED,
+]
+# Same weights/dimension as DEFAULT_EMBEDDING_MODEL, exported to ONNX
+DEFAULT_FASTEMBED_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Summarization
+SUMMARY_BATCH_SIZE = 6  # Articles per batched summarization prompt
+SUMMARY_CACHE_MAX_SIZE = 512  # Cached summaries kept per service instance
 
 # API Configuration
 DEFAULT_API_TITLE = "Stock Investment AI Service"
@@ -35,20 +82,20 @@ CONFIDENCE_MEDIUM_SCORE = 50.0
 CONFIDENCE_LOW_SCORE = 35.0
 
 # Trend Keywords
-TREND_UP_KEYWORDS = ["tăng", "up", "bullish", "tích cực"]
-TREND_DOWN_KEYWORDS = ["giảm", "down", "bearish", "tiêu cực"]
+TREND_UP_KEYWORDS = frozenset({"tăng", "up", "bullish", "tích cực"})
+TREND_DOWN_KEYWORDS = frozenset({"giảm", "down", "bearish", "tiêu cực"})
 
 # Confidence Keywords
-CONFIDENCE_HIGH_KEYWORDS = ["cao", "high", ">70", "mạnh"]
-CONFIDENCE_LOW_KEYWORDS = ["thấp", "low", "<50", "yếu"]
+CONFIDENCE_HIGH_KEYWORDS = frozenset({"cao", "high", ">70", "mạnh"})
+CONFIDENCE_LOW_KEYWORDS = frozenset({"thấp", "low", "<50", "yếu"})
 
 # Recommendation Keywords
-RECOMMENDATION_BUY_KEYWORDS = ["mua", "buy", "tích lũy"]
-RECOMMENDATION_SELL_KEYWORDS = ["bán", "sell", "thoát"]
+RECOMMENDATION_BUY_KEYWORDS = frozenset({"mua", "buy", "tích lũy"})
+RECOMMENDATION_SELL_KEYWORDS = frozenset({"bán", "sell", "thoát"})
 
 # Sentiment Keywords
-SENTIMENT_POSITIVE_KEYWORDS = ["positive", "tích cực", "tăng", "tốt", "khả quan", "lạc quan"]
-SENTIMENT_NEGATIVE_KEYWORDS = ["negative", "tiêu cực", "giảm", "xấu", "bi quan", "lo ngại"]
+SENTIMENT_POSITIVE_KEYWORDS = frozenset({"positive", "tích cực", "tăng", "tốt", "khả quan", "lạc quan"})
+SENTIMENT_NEGATIVE_KEYWORDS = frozenset({"negative", "tiêu cực", "giảm", "xấu", "bi quan", "lo ngại"})
 
 # Insight Type Mapping
 INSIGHT_TYPE_MAPPING = {
@@ -61,7 +108,8 @@ INSIGHT_TYPE_MAPPING = {
 }
 
 # Quota Error Patterns
-QUOTA_ERROR_PATTERNS = ['429', 'quota', 'Quota exceeded', 'rate limit']
+QUOTA_ERROR_PATTERNS = frozenset({'429', 'quota', 'Quota exceeded', 'rate limit'})
+QUOTA_ERROR_RE = _keyword_pattern(QUOTA_ERROR_PATTERNS)
 
 # HTTP Status Codes
 HTTP_OK = 200
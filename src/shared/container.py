@@ -1,20 +1,27 @@
 """Dependency Injection container for the AI Service."""
-from typing import Type, TypeVar, Callable, Any, Dict, Optional
+import sys
+from typing import Type, TypeVar, Callable, Any, Dict, Optional, Tuple
 from functools import lru_cache
 from src.shared.logging import get_logger
 
 T = TypeVar("T")
 logger = get_logger(__name__)
 
+# Registry entry kinds
+_SINGLETON = 0  # Value is the instance
+_SINGLETON_FACTORY = 1  # Value is called once, then replaced by its instance
+_TRANSIENT = 2  # Value is called on every resolve
+
 
 class Container:
     """Simple dependency injection container."""
     
+    __slots__ = ("_registry",)
+    
     def __init__(self):
         """Initialize the container."""
-        self._singletons: Dict[str, Any] = {}
-        self._factories: Dict[str, Callable[[], Any]] = {}
-        self._transients: Dict[str, Callable[[], Any]] = {}
+        # One lookup per resolve: key -> (kind, instance or factory)
+        self._registry: Dict[str, Tuple[int, Any]] = {}
     
     def register_singleton(
         self,
@@ -23,12 +30,13 @@ class Container:
         override: bool = False
     ) -> None:
         """Register a singleton instance."""
-        if key in self._singletons and not override:
-            logger.warning(f"Singleton {key} already registered. Use override=True to replace.")
+        if key in self._registry and not override:
+            logger.warning("Singleton %s already registered. Use override=True to replace.", key)
             return
         
-        self._singletons[key] = instance
-        logger.debug(f"Registered singleton: {key}")
+        key = sys.intern(key)  # Identity fast path for resolve lookups
+        self._registry[key] = (_SINGLETON, instance)
+        logger.debug("Registered singleton: %s", key)
     
     def register_factory(
         self,
@@ -37,12 +45,13 @@ class Container:
         override: bool = False
     ) -> None:
         """Register a factory function (creates new instance each time)."""
-        if key in self._transients and not override:
-            logger.warning(f"Factory {key} already registered. Use override=True to replace.")
+        if key in self._registry and not override:
+            logger.warning("Factory %s already registered. Use override=True to replace.", key)
             return
         
-        self._transients[key] = factory
-        logger.debug(f"Registered factory: {key}")
+        key = sys.intern(key)
+        self._registry[key] = (_TRANSIENT, factory)
+        logger.debug("Registered factory: %s", key)
     
     def register_singleton_factory(
         self,
@@ -51,30 +60,31 @@ class Container:
         override: bool = False
     ) -> None:
         """Register a singleton factory (creates instance once, reuses it)."""
-        if key in self._factories and not override:
-            logger.warning(f"Singleton factory {key} already registered. Use override=True to replace.")
+        if key in self._registry and not override:
+            logger.warning("Singleton factory %s already registered. Use override=True to replace.", key)
             return
         
-        self._factories[key] = factory
-        logger.debug(f"Registered singleton factory: {key}")
+        key = sys.intern(key)
+        self._registry[key] = (_SINGLETON_FACTORY, factory)
+        logger.debug("Registered singleton factory: %s", key)
     
     def resolve(self, key: str) -> Any:
         """Resolve a dependency by key."""
-        # Check singletons
-        if key in self._singletons:
-            return self._singletons[key]
-        
-        # Check singleton factories
-        if key in self._factories:
-            if key not in self._singletons:
-                self._singletons[key] = self._factories[key]()
-            return self._singletons[key]
+        entry = self._registry.get(key)
+        if entry is None:
+            raise ValueError(f"Dependency {key} not registered in container")
         
-        # Check transient factories
-        if key in self._transients:
-            return self._transients[key]()
+        kind, value = entry
+        if kind == _SINGLETON:
+            return value
+        if kind == _TRANSIENT:
+            return value()
         
-        raise ValueError(f"Dependency {key} not registered in container")
+        # First resolve of a singleton factory: cache the instance in its place
+        instance = value()
+        key = sys.intern(key)  # Identity fast path for resolve lookups
+        self._registry[key] = (_SINGLETON, instance)
+        return instance
     
     def get(self, key: str, default: Any = None) -> Optional[Any]:
         """Get a dependency or return default if not found."""
@@ -85,23 +95,18 @@ class Container:
     
     def has(self, key: str) -> bool:
         """Check if a dependency is registered."""
-        return key in self._singletons or key in self._factories or key in self._transients
+        return key in self._registry
     
     def clear(self) -> None:
         """Clear all registered dependencies (useful for testing)."""
-        self._singletons.clear()
-        self._factories.clear()
-        self._transients.clear()
+        self._registry.clear()
         logger.debug("Container cleared")
 
 
-# Global container instance
-_container: Optional[Container] = None
+# Global container instance, created at import
+_container = Container()
 
 
 def get_container() -> Container:
     """Get the global container instance."""
-    global _container
-    if _container is None:
-        _container = Container()
     return _container
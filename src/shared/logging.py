@@ -1,14 +1,28 @@
 """Structured logging configuration for the AI Service."""
 import logging
 import sys
-import json
+import time
+from functools import lru_cache
 from typing import Any, Dict
 from contextvars import ContextVar
-from datetime import datetime
+import orjson
 from src.shared.config import get_settings
 
 # Context variable for request ID
 request_id_ctx: ContextVar[str] = ContextVar("request_id", default="")
+_current_request_id = request_id_ctx.get
+
+
+@lru_cache(maxsize=4)
+def _utc_second(seconds: int) -> str:
+    """Format a whole UTC second (records arrive in time order, so hits dominate)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def _format_timestamp(created: float) -> str:
+    """Format a record creation time as an ISO 8601 UTC timestamp with microseconds."""
+    micros = int(created * 1_000_000)
+    return f"{_utc_second(micros // 1_000_000)}.{micros % 1_000_000:06d}"
 
 
 class JSONFormatter(logging.Formatter):
@@ -17,7 +31,7 @@ class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -26,8 +40,8 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
         
-        # Add request ID if available
-        request_id = request_id_ctx.get()
+        # Add request ID if available; one passed via extra= is already on the record
+        request_id = record.__dict__.get("request_id") or _current_request_id()
         if request_id:
             log_data["request_id"] = request_id
         
@@ -39,23 +53,25 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra"):
             log_data.update(record.extra)
         
-        return json.dumps(log_data, ensure_ascii=False)
+        # Extra fields may hold arbitrary objects; fall back to their str() form
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
 
 
 def setup_logging() -> None:
     """Setup application logging."""
     settings = get_settings()
+    level = getattr(logging, settings.log_level)
     
     # Create root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, settings.log_level))
+    root_logger.setLevel(level)
     
     # Remove existing handlers
     root_logger.handlers.clear()
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, settings.log_level))
+    console_handler.setLevel(level)
     
     # Set formatter
     if settings.log_format.lower() == "json":
@@ -74,6 +90,7 @@ def setup_logging() -> None:
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the given name."""
     return logging.getLogger(name)
@@ -86,7 +103,7 @@ def set_request_id(request_id: str) -> None:
 
 def get_request_id() -> str:
     """Get current request ID from context."""
-    return request_id_ctx.get()
+    return _current_request_id()
 
 
 # Setup logging on import
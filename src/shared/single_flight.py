@@ -0,0 +1,84 @@
+"""In-flight request deduplication for concurrent identical calls."""
+import asyncio
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+import orjson
+from src.shared.logging import get_logger
+
+T = TypeVar("T")
+logger = get_logger(__name__)
+
+
+class _LeaderCancelled(Exception):
+    """Set on a shared call when its leader was cancelled, so waiters retry."""
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into a single execution.
+
+    The first caller for a key runs the call; callers arriving while it is in
+    flight await the same result (or exception) instead of starting their own.
+    If the leading caller is cancelled, its waiters are not: one of them
+    re-runs the call for the rest. Every caller receives the same result
+    object, so callers that mutate it (or hand it out) must copy it first.
+    """
+
+    def __init__(self):
+        """Initialize the in-flight registry."""
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """
+        Build a stable key from call inputs.
+
+        Args:
+            parts: JSON-serializable inputs (other values are stringified)
+
+        Returns:
+            Hex digest identifying the inputs
+        """
+        payload = orjson.dumps(
+            parts,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn once for all concurrent callers using the same key.
+
+        Args:
+            key: Deduplication key (see key())
+            fn: Zero-argument coroutine function performing the call
+
+        Returns:
+            Result of the single shared call
+        """
+        while (inflight := self._inflight.get(key)) is not None:
+            logger.debug("Joining in-flight call for identical inputs")
+            try:
+                return await asyncio.shield(inflight)
+            except _LeaderCancelled:
+                continue  # Leader went away; the first waiter to resume runs fn
+
+        future: "asyncio.Future[T]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # Only this caller was cancelled; don't cancel the joined waiters
+            future.set_exception(_LeaderCancelled())
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(result)
+        return result
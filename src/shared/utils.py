@@ -1,6 +1,7 @@
 """Utility functions for the AI Service."""
 import re
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, FrozenSet, Set
 from src.shared.constants import (
     TREND_UP_KEYWORDS, TREND_DOWN_KEYWORDS,
     CONFIDENCE_HIGH_KEYWORDS, CONFIDENCE_LOW_KEYWORDS,
@@ -13,6 +14,68 @@ from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Keyword groups lowercased once here, since scanned text is lowercased before matching
+_TREND_UP = frozenset(keyword.lower() for keyword in TREND_UP_KEYWORDS)
+_TREND_DOWN = frozenset(keyword.lower() for keyword in TREND_DOWN_KEYWORDS)
+_CONFIDENCE_HIGH = frozenset(keyword.lower() for keyword in CONFIDENCE_HIGH_KEYWORDS)
+_CONFIDENCE_LOW = frozenset(keyword.lower() for keyword in CONFIDENCE_LOW_KEYWORDS)
+_RECOMMENDATION_BUY = frozenset(keyword.lower() for keyword in RECOMMENDATION_BUY_KEYWORDS)
+_RECOMMENDATION_SELL = frozenset(keyword.lower() for keyword in RECOMMENDATION_SELL_KEYWORDS)
+_SENTIMENT_POSITIVE = frozenset(keyword.lower() for keyword in SENTIMENT_POSITIVE_KEYWORDS)
+_SENTIMENT_NEGATIVE = frozenset(keyword.lower() for keyword in SENTIMENT_NEGATIVE_KEYWORDS)
+
+_ALL_KEYWORDS = (
+    _TREND_UP | _TREND_DOWN
+    | _CONFIDENCE_HIGH | _CONFIDENCE_LOW
+    | _RECOMMENDATION_BUY | _RECOMMENDATION_SELL
+    | _SENTIMENT_POSITIVE | _SENTIMENT_NEGATIVE
+)
+
+# Each keyword -> every keyword occurring inside it (itself included), so a longer
+# match also reports the shorter keywords it hides
+_KEYWORD_CLOSURE: Dict[str, FrozenSet[str]] = {
+    keyword: frozenset(other for other in _ALL_KEYWORDS if other in keyword)
+    for keyword in _ALL_KEYWORDS
+}
+
+# All extractor keywords in one alternation; the zero-width lookahead tries every
+# start position, so overlapping occurrences are not consumed by earlier matches
+_KEYWORD_RE = re.compile(
+    "(?=("
+    + "|".join(map(re.escape, sorted(_ALL_KEYWORDS, key=lambda word: (-len(word), word))))
+    + "))"
+)
+
+# Bullet or numbered list line; group 1 is the item text
+_BULLET_RE = re.compile(r'^[\s\-\*\d\.]+(.+)$')
+
+# Matches nothing; used when no section keywords are given
+_NEVER_RE = re.compile(r'(?!)')
+
+
+@lru_cache(maxsize=64)
+def _section_pattern(keywords: tuple) -> "re.Pattern[str]":
+    """Compile section keywords into one alternation (callers pass a few fixed lists)."""
+    if not keywords:
+        return _NEVER_RE
+    return re.compile("|".join(re.escape(keyword.lower()) for keyword in keywords))
+
+
+def _scan(text: str) -> FrozenSet[str]:
+    """
+    Find every extractor keyword present in text in a single pass.
+    
+    Args:
+        text: Text to scan
+        
+    Returns:
+        Keywords occurring in the lowercased text
+    """
+    found: Set[str] = set()
+    for match in _KEYWORD_RE.finditer(text.lower()):
+        found |= _KEYWORD_CLOSURE[match.group(1)]
+    return frozenset(found)
+
 
 def extract_list_items(text: str, keywords: List[str]) -> List[str]:
     """
@@ -26,37 +89,86 @@ def extract_list_items(text: str, keywords: List[str]) -> List[str]:
         List of extracted items
     """
     items = []
-    lines = text.split('\n')
+    section_re = _section_pattern(tuple(keywords))
     in_section = False
     
-    for line in lines:
+    for line in text.split('\n'):
         # Check if we're in the relevant section
-        if any(keyword in line.lower() for keyword in keywords):
+        if section_re.search(line.lower()):
             in_section = True
             continue
         
+        if not in_section:
+            continue
+        
+        # Stop at next section (keyword lines were handled above)
+        stripped = line.strip()
+        if stripped.startswith('#') or (
+            stripped and 
+            stripped[0].isdigit() and 
+            '.' in line[:3]
+        ):
+            in_section = False
+            continue
+        
         # Extract bullet points or numbered items
-        if in_section:
-            # Stop at next section
-            if line.strip().startswith('#') or (
-                line.strip() and 
-                line.strip()[0].isdigit() and 
-                '.' in line[:3]
-            ):
-                if not any(keyword in line.lower() for keyword in keywords):
-                    in_section = False
-                    continue
-            
-            # Extract item
-            match = re.match(r'^[\s\-\*\d\.]+(.+)$', line)
-            if match:
-                item = match.group(1).strip()
-                if item and len(item) > 5:
-                    items.append(item)
+        match = _BULLET_RE.match(line)
+        if match:
+            item = match.group(1).strip()
+            if item and len(item) > 5:
+                items.append(item)
     
     return items
 
 
+def _classify_trend(found: FrozenSet[str]) -> str:
+    """Classify trend from scanned keywords."""
+    if not _TREND_UP.isdisjoint(found):
+        return "Up"
+    elif not _TREND_DOWN.isdisjoint(found):
+        return "Down"
+    else:
+        return "Sideways"
+
+
+def _classify_confidence(found: FrozenSet[str]) -> tuple[str, float]:
+    """Classify confidence level and score from scanned keywords."""
+    if not _CONFIDENCE_HIGH.isdisjoint(found):
+        return "High", CONFIDENCE_HIGH_SCORE
+    elif not _CONFIDENCE_LOW.isdisjoint(found):
+        return "Low", CONFIDENCE_LOW_SCORE
+    else:
+        return "Medium", CONFIDENCE_MEDIUM_SCORE
+
+
+def _classify_recommendation(found: FrozenSet[str]) -> str:
+    """Classify recommendation from scanned keywords."""
+    if not _RECOMMENDATION_BUY.isdisjoint(found):
+        return "Buy"
+    elif not _RECOMMENDATION_SELL.isdisjoint(found):
+        return "Sell"
+    else:
+        return "Hold"
+
+
+def analyze_response(response: str) -> Dict[str, Any]:
+    """
+    Extract trend, confidence and recommendation from AI response in one scan.
+    
+    Args:
+        response: AI response text
+        
+    Returns:
+        Dictionary with "trend", "confidence" ((level, score) tuple) and "recommendation"
+    """
+    found = _scan(response)
+    return {
+        "trend": _classify_trend(found),
+        "confidence": _classify_confidence(found),
+        "recommendation": _classify_recommendation(found)
+    }
+
+
 def extract_trend(response: str) -> str:
     """
     Extract trend from AI response.
@@ -67,14 +179,7 @@ def extract_trend(response: str) -> str:
     Returns:
         Trend: "Up", "Down", or "Sideways"
     """
-    response_lower = response.lower()
-    
-    if any(word in response_lower for word in TREND_UP_KEYWORDS):
-        return "Up"
-    elif any(word in response_lower for word in TREND_DOWN_KEYWORDS):
-        return "Down"
-    else:
-        return "Sideways"
+    return _classify_trend(_scan(response))
 
 
 def extract_confidence(response: str) -> tuple[str, float]:
@@ -87,14 +192,7 @@ def extract_confidence(response: str) -> tuple[str, float]:
     Returns:
         Tuple of (confidence_level, confidence_score)
     """
-    response_lower = response.lower()
-    
-    if any(word in response_lower for word in CONFIDENCE_HIGH_KEYWORDS):
-        return "High", CONFIDENCE_HIGH_SCORE
-    elif any(word in response_lower for word in CONFIDENCE_LOW_KEYWORDS):
-        return "Low", CONFIDENCE_LOW_SCORE
-    else:
-        return "Medium", CONFIDENCE_MEDIUM_SCORE
+    return _classify_confidence(_scan(response))
 
 
 def extract_recommendation(response: str) -> str:
@@ -107,14 +205,7 @@ def extract_recommendation(response: str) -> str:
     Returns:
         Recommendation: "Buy", "Hold", or "Sell"
     """
-    response_lower = response.lower()
-    
-    if any(word in response_lower for word in RECOMMENDATION_BUY_KEYWORDS):
-        return "Buy"
-    elif any(word in response_lower for word in RECOMMENDATION_SELL_KEYWORDS):
-        return "Sell"
-    else:
-        return "Hold"
+    return _classify_recommendation(_scan(response))
 
 
 def extract_sentiment(text: str) -> str:
@@ -127,16 +218,11 @@ def extract_sentiment(text: str) -> str:
     Returns:
         Sentiment: "positive", "negative", or "neutral"
     """
-    text_lower = text.lower()
+    found = _scan(text)
     
-    positive_count = sum(
-        1 for keyword in SENTIMENT_POSITIVE_KEYWORDS
-        if keyword in text_lower
-    )
-    negative_count = sum(
-        1 for keyword in SENTIMENT_NEGATIVE_KEYWORDS
-        if keyword in text_lower
-    )
+    # Count distinct keywords present per polarity
+    positive_count = len(_SENTIMENT_POSITIVE & found)
+    negative_count = len(_SENTIMENT_NEGATIVE & found)
     
     if positive_count > negative_count:
         return "positive"
@@ -146,6 +232,7 @@ def extract_sentiment(text: str) -> str:
         return "neutral"
 
 
+@lru_cache(maxsize=32)
 def normalize_insight_type(insight_type: str) -> str:
     """
     Normalize insight type to standard values.
@@ -159,6 +246,42 @@ def normalize_insight_type(insight_type: str) -> str:
     return INSIGHT_TYPE_MAPPING.get(insight_type.lower(), "Hold")
 
 
+class _SafeDict(dict):
+    """Template mapping that renders missing fields as N/A."""
+    
+    def __missing__(self, key: str) -> str:
+        return 'N/A'
+
+
+_TECHNICAL_TEMPLATE = """1. CHỈ SỐ KỸ THUẬT:
+- MA (Moving Average): {ma}
+- RSI (Relative Strength Index): {rsi}
+- MACD: {macd}
+- Bollinger Bands: {bollinger}
+- Volume: {volume}
+- Price Trend: {trend}
+
+"""
+
+_FUNDAMENTAL_TEMPLATE = """2. CHỈ SỐ TÀI CHÍNH:
+- ROE (Return on Equity): {roe}%
+- ROA (Return on Assets): {roa}%
+- EPS (Earnings Per Share): {eps}
+- P/E Ratio: {pe}
+- Revenue Growth: {revenue_growth}%
+- Profit Margin: {profit_margin}%
+
+"""
+
+_SENTIMENT_TEMPLATE = """3. PHÂN TÍCH TÂM LÝ THỊ TRƯỜNG:
+- Sentiment Score: {score}
+- News Sentiment: {sentiment}
+- Social Media Buzz: {social_buzz}
+- Recent News: {recent_news}
+
+"""
+
+
 def format_technical_data(technical_data: Optional[Dict[str, Any]]) -> str:
     """
     Format technical data for prompt.
@@ -172,15 +295,7 @@ def format_technical_data(technical_data: Optional[Dict[str, Any]]) -> str:
     if not technical_data:
         return ""
     
-    return f"""1. CHỈ SỐ KỸ THUẬT:
-- MA (Moving Average): {technical_data.get('ma', 'N/A')}
-- RSI (Relative Strength Index): {technical_data.get('rsi', 'N/A')}
-- MACD: {technical_data.get('macd', 'N/A')}
-- Bollinger Bands: {technical_data.get('bollinger', 'N/A')}
-- Volume: {technical_data.get('volume', 'N/A')}
-- Price Trend: {technical_data.get('trend', 'N/A')}
-
-"""
+    return _TECHNICAL_TEMPLATE.format_map(_SafeDict(technical_data))
 
 
 def format_fundamental_data(fundamental_data: Optional[Dict[str, Any]]) -> str:
@@ -196,15 +311,7 @@ def format_fundamental_data(fundamental_data: Optional[Dict[str, Any]]) -> str:
     if not fundamental_data:
         return ""
     
-    return f"""2. CHỈ SỐ TÀI CHÍNH:
-- ROE (Return on Equity): {fundamental_data.get('roe', 'N/A')}%
-- ROA (Return on Assets): {fundamental_data.get('roa', 'N/A')}%
-- EPS (Earnings Per Share): {fundamental_data.get('eps', 'N/A')}
-- P/E Ratio: {fundamental_data.get('pe', 'N/A')}
-- Revenue Growth: {fundamental_data.get('revenue_growth', 'N/A')}%
-- Profit Margin: {fundamental_data.get('profit_margin', 'N/A')}%
-
-"""
+    return _FUNDAMENTAL_TEMPLATE.format_map(_SafeDict(fundamental_data))
 
 
 def format_sentiment_data(sentiment_data: Optional[Dict[str, Any]]) -> str:
@@ -220,10 +327,4 @@ def format_sentiment_data(sentiment_data: Optional[Dict[str, Any]]) -> str:
     if not sentiment_data:
         return ""
     
-    return f"""3. PHÂN TÍCH TÂM LÝ THỊ TRƯỜNG:
-- Sentiment Score: {sentiment_data.get('score', 'N/A')}
-- News Sentiment: {sentiment_data.get('sentiment', 'N/A')}
-- Social Media Buzz: {sentiment_data.get('social_buzz', 'N/A')}
-- Recent News: {sentiment_data.get('recent_news', 'N/A')}
-
-"""
+    return _SENTIMENT_TEMPLATE.format_map(_SafeDict(sentiment_data))
@@ -1,7 +1,9 @@
 """Pytest configuration and fixtures for AI Service tests."""
+import asyncio
 import os
+import numpy as np
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, create_autospec
 from typing import Dict, Any, List
 
 # Set default environment variables for testing
@@ -25,20 +27,45 @@ from src.application.use_cases.summarize_news import SummarizeNewsUseCase
 from src.application.use_cases.analyze_event import AnalyzeEventUseCase
 from src.application.use_cases.parse_alert import ParseAlertUseCase
 
+# Shared by reference across tests; tests only read it
+_EMBEDDING_VECTOR = [0.1] * 384
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    Run all async tests on one event loop per session (asyncio_mode = auto).
+    
+    Replaces pytest-asyncio's per-test loop, so tests must not leave tasks
+    running or close the loop themselves.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_dependency_overrides():
+    """Restore app.dependency_overrides after every test (tests may set their own)."""
+    snapshot = dict(app.dependency_overrides)
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(snapshot)
+
 
 @pytest.fixture
 def mock_llm_provider() -> Mock:
     """Create a mock LLM provider."""
-    mock = Mock(spec=LLMProvider)
-    mock.generate = AsyncMock(return_value="Mocked LLM response")
+    mock = create_autospec(LLMProvider, instance=True, spec_set=True)
+    mock.generate.return_value = "Mocked LLM response"
     return mock
 
 
 @pytest.fixture
 def mock_vector_store() -> Mock:
     """Create a mock vector store."""
-    mock = Mock(spec=VectorStore)
-    mock.search = AsyncMock(return_value=[
+    mock = create_autospec(VectorStore, instance=True, spec_set=True)
+    mock.search.return_value = [
         {
             "documentId": "doc-1",
             "source": "analysis_report",
@@ -50,20 +77,44 @@ def mock_vector_store() -> Mock:
             "score": 0.9,
             "text": "Test document content"
         }
-    ])
-    mock.upsert = AsyncMock(return_value=None)
+    ]
+    mock.upsert.return_value = None
+    mock.upsert_chunks.return_value = None
     return mock
 
 
 @pytest.fixture
 def mock_embedding_provider() -> Mock:
     """Create a mock embedding provider."""
-    mock = Mock(spec=EmbeddingProvider)
-    mock.generate_embedding = AsyncMock(return_value=[0.1] * 384)
+    mock = create_autospec(EmbeddingProvider, instance=True, spec_set=True)
+    mock.generate_embedding.return_value = _EMBEDDING_VECTOR
+    mock.generate_embeddings.side_effect = (
+        lambda texts: [_EMBEDDING_VECTOR for _ in texts]
+    )
+    mock.generate_embeddings_np.side_effect = (
+        lambda texts: np.full((len(texts), 384), 0.1, dtype=np.float32)
+    )
     return mock
 
 
 @pytest.fixture
+def async_return():
+    """
+    Build plain coroutine stubs for mocked async methods.
+    
+    Call the returned function with a value, e.g.
+    mock_llm_provider.generate = async_return("text"). Use AsyncMock instead
+    when the test asserts on calls.
+    """
+    def make(value: Any):
+        async def stub(*args: Any, **kwargs: Any) -> Any:
+            return value
+        return stub
+
+    return make
+
+
+@pytest.fixture(scope="session")
 def sample_forecast_response() -> str:
     """Sample forecast response from LLM."""
     return """Dựa trên phân tích:
@@ -83,7 +134,7 @@ Rủi ro:
 Khuyến nghị: Mua"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_insight_json() -> str:
     """Sample insight JSON response from LLM."""
     return """{
@@ -97,6 +148,13 @@ def sample_insight_json() -> str:
 }"""
 
 
+@pytest.fixture(scope="session")
+def long_vietnamese_text() -> str:
+    """Long multi-paragraph Vietnamese text (20 paragraphs, ~10KB) for chunking tests."""
+    body = "Nội dung " * 50
+    return "\n\n".join(f"Đoạn văn số {i}. {body}" for i in range(20))
+
+
 @pytest.fixture
 def override_dependencies(mock_llm_provider, mock_vector_store, mock_embedding_provider):
     """Override FastAPI dependencies with mocks for testing."""
@@ -114,7 +172,7 @@ def override_dependencies(mock_llm_provider, mock_vector_store, mock_embedding_p
     mock_summarization_service = SummarizationService(mock_llm_provider)
     mock_sentiment_service = SentimentService(mock_llm_provider)
     mock_nlp_parser_service = NLPParserService(mock_llm_provider)
-    mock_stock_data_service = Mock(spec=StockDataService)
+    mock_stock_data_service = create_autospec(StockDataService, instance=True, spec_set=True)
     
     app.dependency_overrides[dependencies.get_qa_service] = lambda: mock_qa_service
     app.dependency_overrides[dependencies.get_forecast_service] = lambda: mock_forecast_service
@@ -132,7 +190,8 @@ def override_dependencies(mock_llm_provider, mock_vector_store, mock_embedding_p
     app.dependency_overrides[dependencies.get_analyze_event_use_case] = lambda: AnalyzeEventUseCase(mock_sentiment_service)
     app.dependency_overrides[dependencies.get_parse_alert_use_case] = lambda: ParseAlertUseCase(mock_nlp_parser_service)
     
-    yield {
+    # Removed after the test by reset_dependency_overrides
+    return {
         "llm_provider": mock_llm_provider,
         "vector_store": mock_vector_store,
         "embedding_provider": mock_embedding_provider,
@@ -141,6 +200,3 @@ def override_dependencies(mock_llm_provider, mock_vector_store, mock_embedding_p
         "insight_service": mock_insight_service,
         "stock_data_service": mock_stock_data_service,
     }
-    
-    # Cleanup: clear all overrides
-    app.dependency_overrides.clear()
@@ -0,0 +1,97 @@
+"""Pytest fixtures shared by the integration tests."""
+from dataclasses import replace
+from typing import Any, AsyncIterator, Callable, Iterator
+from unittest.mock import Mock
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from src.api.main import app
+from src.application.services.rag_ingest_service import RagIngestService
+from src.shared.config import get_settings
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """
+    Create one test client for the whole session.
+    
+    Entering the client runs the app's startup/shutdown events once, and a
+    /health request warms the request path (middleware, routing, logging) so
+    the first test does not pay for it. Tests still set and clear
+    app.dependency_overrides themselves; the client does not hold override
+    state.
+    """
+    with TestClient(app) as test_client:
+        test_client.get("/health")
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def lenient_client() -> TestClient:
+    """
+    Create a test client that returns 500 responses instead of re-raising.
+    
+    Starlette re-raises unhandled exceptions after the catch-all Exception
+    handler has responded, and the default client passes them on to the test.
+    Use this client to assert on that handler's 500 body. It is not entered
+    as a context manager, so it does not run the app's shutdown event.
+    """
+    return TestClient(app, raise_server_exceptions=False)
+
+
+@pytest_asyncio.fixture
+async def aclient() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Create an async client that calls the app in-process on the test's event loop.
+    
+    Unlike TestClient there is no thread hop per request, so async tests can
+    await several requests concurrently.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest.fixture(scope="session")
+def minimal_ingest_body_bytes() -> bytes:
+    """
+    Serialize the minimal valid ingest request body once per session.
+    
+    Send it with content=... and a JSON content-type so the client skips
+    encoding; tests that change fields should pass their own json= dict.
+    """
+    return orjson.dumps({
+        "document_id": "test-doc",
+        "source": "test",
+        "text": "Test content",
+        "metadata": {}
+    })
+
+
+@pytest.fixture
+def rag_ingest_service(mock_vector_store: Mock, mock_embedding_provider: Mock) -> RagIngestService:
+    """
+    Build a RAG ingest service over the shared mock vector store and embedding provider.
+    
+    Tests adjust return values on mock_vector_store (e.g.
+    mock_vector_store.delete_document.return_value = 17) instead of rebuilding it.
+    """
+    return RagIngestService(mock_vector_store, mock_embedding_provider)
+
+
+@pytest.fixture
+def settings_override() -> Callable[..., None]:
+    """
+    Override settings fields for the app's get_settings dependency.
+    
+    Call the returned function with field values, e.g.
+    settings_override(internal_api_key="secret"). The override is removed
+    after the test with the other dependency overrides.
+    """
+    def apply(**changes: Any) -> None:
+        overridden = replace(get_settings(), **changes)
+        app.dependency_overrides[get_settings] = lambda: overridden
+
+    return apply
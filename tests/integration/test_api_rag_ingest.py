@@ -1,54 +1,31 @@
 """Integration tests for RAG ingest endpoint."""
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, Mock
 from src.api.main import app
-from src.application.services.rag_ingest_service import RagIngestService
-from src.domain.interfaces.vector_store import VectorStore
-from src.domain.interfaces.embedding_provider import EmbeddingProvider
 from src.api import dependencies
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
 @pytest.mark.integration
-def test_rag_ingest_endpoint_with_chunk_params(client, monkeypatch):
+async def test_rag_ingest_endpoint_with_chunk_params(aclient, settings_override, mock_vector_store, rag_ingest_service):
     """Test POST /api/rag/ingest endpoint with custom chunk parameters."""
-    monkeypatch.delenv("INTERNAL_API_KEY", raising=False)
-    from src.shared import config
-    config._settings = None
-    mock_vector_store = Mock(spec=VectorStore)
-    mock_embedding_provider = Mock(spec=EmbeddingProvider)
-    mock_embedding_provider.generate_embedding = AsyncMock(return_value=[0.1] * 8)
-    mock_vector_store.upsert_chunks = AsyncMock(return_value=None)
-    mock_vector_store.collection_name = "stock_documents"
+    settings_override(internal_api_key=None)
 
-    service = RagIngestService(mock_vector_store, mock_embedding_provider)
-
-    app.dependency_overrides[dependencies.get_rag_ingest_service] = lambda: service
-    try:
-        response = client.post(
-            "/api/rag/ingest",
-            json={
-                "document_id": "report-abc-2024",
-                "source": "analysis_report",
-                "text": "Đoạn 1.\n\nĐoạn 2 có nội dung dài hơn một chút.\n\nĐoạn 3 thêm text.",
-                "metadata": {
-                    "sourceUrl": "https://example.com/report",
-                    "title": "Báo cáo Q2",
-                    "symbol": "VNM",
-                    "section": "Tài chính"
-                },
-                "chunk_size": 400,
-                "chunk_overlap": 80
-            }
-        )
-    finally:
-        app.dependency_overrides.clear()
+    app.dependency_overrides[dependencies.get_rag_ingest_service] = lambda: rag_ingest_service
+    response = await aclient.post(
+        "/api/rag/ingest",
+        json={
+            "document_id": "report-abc-2024",
+            "source": "analysis_report",
+            "text": "Đoạn 1.\n\nĐoạn 2 có nội dung dài hơn một chút.\n\nĐoạn 3 thêm text.",
+            "metadata": {
+                "sourceUrl": "https://example.com/report",
+                "title": "Báo cáo Q2",
+                "symbol": "VNM",
+                "section": "Tài chính"
+            },
+            "chunk_size": 400,
+            "chunk_overlap": 80
+        }
+    )
 
     assert response.status_code == 200
     data = response.json()
@@ -77,38 +54,25 @@ def test_rag_ingest_endpoint_with_chunk_params(client, monkeypatch):
 
 
 @pytest.mark.integration
-def test_rag_ingest_endpoint_long_text(client, monkeypatch):
+async def test_rag_ingest_endpoint_long_text(
+    aclient, settings_override, rag_ingest_service, long_vietnamese_text
+):
     """Test POST /api/rag/ingest with long text to ensure chunking doesn't crash."""
-    monkeypatch.delenv("INTERNAL_API_KEY", raising=False)
-    from src.shared import config
-    config._settings = None
-    mock_vector_store = Mock(spec=VectorStore)
-    mock_embedding_provider = Mock(spec=EmbeddingProvider)
-    mock_embedding_provider.generate_embedding = AsyncMock(return_value=[0.1] * 8)
-    mock_vector_store.upsert_chunks = AsyncMock(return_value=None)
-    mock_vector_store.collection_name = "stock_documents"
-
-    service = RagIngestService(mock_vector_store, mock_embedding_provider)
+    settings_override(internal_api_key=None)
 
-    # Generate long text with multiple paragraphs
-    long_text = "\n\n".join([f"Đoạn văn số {i}. " + "Nội dung " * 50 for i in range(20)])
-
-    app.dependency_overrides[dependencies.get_rag_ingest_service] = lambda: service
-    try:
-        response = client.post(
-            "/api/rag/ingest",
-            json={
-                "document_id": "long-doc-2024",
-                "source": "analysis_report",
-                "text": long_text,
-                "metadata": {
-                    "title": "Long Document",
-                    "symbol": "ABC"
-                }
+    app.dependency_overrides[dependencies.get_rag_ingest_service] = lambda: rag_ingest_service
+    response = await aclient.post(
+        "/api/rag/ingest",
+        json={
+            "document_id": "long-doc-2024",
+            "source": "analysis_report",
+            "text": long_vietnamese_text,
+            "metadata": {
+                "title": "Long Document",
+                "symbol": "ABC"
             }
-        )
-    finally:
-        app.dependency_overrides.clear()
+        }
+    )
 
     assert response.status_code == 200
     data = response.json()
@@ -118,152 +82,52 @@ def test_rag_ingest_endpoint_long_text(client, monkeypatch):
 
 
 @pytest.mark.integration
-def test_rag_ingest_without_api_key_when_not_configured(client, monkeypatch):
-    """Test ingest without API key when INTERNAL_API_KEY is not set (should succeed)."""
-    # Ensure INTERNAL_API_KEY is not set
-    monkeypatch.delenv("INTERNAL_API_KEY", raising=False)
-    
-    # Force reload settings to pick up env change
-    from src.shared import config
-    config._settings = None
-    
-    mock_vector_store = Mock(spec=VectorStore)
-    mock_embedding_provider = Mock(spec=EmbeddingProvider)
-    mock_embedding_provider.generate_embedding = AsyncMock(return_value=[0.1] * 8)
-    mock_vector_store.upsert_chunks = AsyncMock(return_value=None)
-    mock_vector_store.collection_name = "stock_documents"
-
-    service = RagIngestService(mock_vector_store, mock_embedding_provider)
-
-    app.dependency_overrides[dependencies.get_rag_ingest_service] = lambda: service
-    try:
-        # Request WITHOUT X-Internal-Api-Key header
-        response = client.post(
-            "/api/rag/ingest",
-            json={
-                "document_id": "test-doc",
-                "source": "test",
-                "text": "Test content",
-                "metadata": {}
-            }
-        )
-    finally:
-        app.dependency_overrides.clear()
-
-    # Should succeed (200) when key is not configured
-    assert response.status_code == 200
-
-
-@pytest.mark.integration
-def test_rag_ingest_missing_header_when_key_configured(client, monkeypatch):
-    """Test ingest without header when INTERNAL_API_KEY is set (should fail with 401)."""
-    # Set INTERNAL_API_KEY
-    monkeypatch.setenv("INTERNAL_API_KEY", "test-secret-key")
-    
-    # Force reload settings
-    from src.shared import config
-    config._settings = None
-    
-    mock_vector_store = Mock(spec=VectorStore)
-    mock_embedding_provider = Mock(spec=EmbeddingProvider)
-    mock_embedding_provider.generate_embedding = AsyncMock(return_value=[0.1] * 8)
-    mock_vector_store.upsert_chunks = AsyncMock(return_value=None)
-    mock_vector_store.collection_name = "stock_documents"
-
-    service = RagIngestService(mock_vector_store, mock_embedding_provider)
-
-    app.dependency_overrides[dependencies.get_rag_ingest_service] = lambda: service
-    try:
-        # Request WITHOUT header
-        response = client.post(
-            "/api/rag/ingest",
-            json={
-                "document_id": "test-doc",
-                "source": "test",
-                "text": "Test content",
-                "metadata": {}
-            }
-        )
-    finally:
-        app.dependency_overrides.clear()
-
-    # Should fail with 401
-    assert response.status_code == 401
-    assert "Missing X-Internal-Api-Key header" in response.json()["detail"]
-
-
-@pytest.mark.integration
-def test_rag_ingest_with_valid_header_when_key_configured(client, monkeypatch):
-    """Test ingest with correct header when INTERNAL_API_KEY is set (should succeed)."""
-    # Set INTERNAL_API_KEY
-    monkeypatch.setenv("INTERNAL_API_KEY", "test-secret-key")
-    
-    # Force reload settings
-    from src.shared import config
-    config._settings = None
-    
-    mock_vector_store = Mock(spec=VectorStore)
-    mock_embedding_provider = Mock(spec=EmbeddingProvider)
-    mock_embedding_provider.generate_embedding = AsyncMock(return_value=[0.1] * 8)
-    mock_vector_store.upsert_chunks = AsyncMock(return_value=None)
-    mock_vector_store.collection_name = "stock_documents"
-
-    service = RagIngestService(mock_vector_store, mock_embedding_provider)
-
-    app.dependency_overrides[dependencies.get_rag_ingest_service] = lambda: service
-    try:
-        # Request WITH correct header
-        response = client.post(
-            "/api/rag/ingest",
-            json={
-                "document_id": "test-doc",
-                "source": "test",
-                "text": "Test content",
-                "metadata": {}
-            },
-            headers={"X-Internal-Api-Key": "test-secret-key"}
-        )
-    finally:
-        app.dependency_overrides.clear()
-
-    # Should succeed
-    assert response.status_code == 200
-    data = response.json()
-    assert data["documentId"] == "test-doc"
-
-
-@pytest.mark.integration
-def test_rag_ingest_invalid_chunk_params(client):
-    """Test ingest with invalid chunk parameters (overlap >= size)."""
-    response = client.post(
+@pytest.mark.parametrize("configured_key,header,expected_status", [
+    (None, None, 200),  # Auth disabled when INTERNAL_API_KEY is not set
+    ("test-secret-key", None, 401),  # Header required once the key is set
+    ("test-secret-key", "test-secret-key", 200),
+])
+async def test_rag_ingest_api_key(
+    aclient, settings_override, rag_ingest_service, minimal_ingest_body_bytes,
+    configured_key, header, expected_status
+):
+    """Test ingest authorization with and without INTERNAL_API_KEY configured."""
+    settings_override(internal_api_key=configured_key)
+
+    app.dependency_overrides[dependencies.get_rag_ingest_service] = lambda: rag_ingest_service
+    headers = {"Content-Type": "application/json"}
+    if header:
+        headers["X-Internal-Api-Key"] = header
+    response = await aclient.post(
         "/api/rag/ingest",
-        json={
-            "document_id": "test-doc",
-            "source": "test",
-            "text": "Test content",
-            "metadata": {},
-            "chunk_size": 500,
-            "chunk_overlap": 600  # Invalid: overlap >= size
-        }
+        content=minimal_ingest_body_bytes,
+        headers=headers
     )
 
-    # Should fail with 422 validation error
-    assert response.status_code == 422
+    assert response.status_code == expected_status
+    if expected_status == 401:
+        assert "Missing X-Internal-Api-Key header" in response.json()["detail"]
+    else:
+        assert response.json()["documentId"] == "test-doc"
 
 
 @pytest.mark.integration
-def test_rag_ingest_chunk_size_out_of_range(client):
-    """Test ingest with chunk_size out of valid range."""
-    response = client.post(
+@pytest.mark.validation
+@pytest.mark.parametrize("chunk_params", [
+    {"chunk_size": 500, "chunk_overlap": 600},  # Overlap must be smaller than size
+    {"chunk_size": 100},  # Size below the 300 minimum
+])
+async def test_rag_ingest_rejects_invalid_chunk_params(aclient, chunk_params):
+    """Test ingest returns 422 for chunk parameters that fail validation."""
+    response = await aclient.post(
         "/api/rag/ingest",
         json={
             "document_id": "test-doc",
             "source": "test",
             "text": "Test content",
             "metadata": {},
-            "chunk_size": 100  # Too small (< 300)
+            **chunk_params
         }
     )
 
-    # Should fail with 422 validation error
     assert response.status_code == 422
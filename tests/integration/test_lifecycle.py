@@ -0,0 +1,18 @@
+"""Integration tests for application startup/shutdown."""
+import pytest
+from fastapi.testclient import TestClient
+from src.api.main import app
+from src.api.dependencies import get_llm_provider
+
+
+@pytest.mark.integration
+def test_shutdown_rebuilds_llm_provider():
+    """Test the LLM provider is not reused with a closed HTTP pool after shutdown."""
+    with TestClient(app):
+        provider = get_llm_provider()
+        assert not provider.client._client.is_closed
+
+    rebuilt = get_llm_provider()
+
+    assert rebuilt is not provider
+    assert not rebuilt.client._client.is_closed
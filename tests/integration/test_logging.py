@@ -1,35 +1,17 @@
 """Integration tests for logging and observability."""
 import pytest
-import json
 import logging
-from io import StringIO
-from fastapi.testclient import TestClient
-from src.api.main import app
+from src.api.main import app, _generate_request_id
+from src.api.dependencies import get_stock_data_service
+from src.shared.exceptions import ValidationError
 from src.shared.logging import get_logger, set_request_id, get_request_id
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def log_capture():
-    """Capture logs for testing."""
-    log_stream = StringIO()
-    handler = logging.StreamHandler(log_stream)
-    handler.setLevel(logging.INFO)
-    
-    # Get root logger and add handler
-    root_logger = logging.getLogger()
-    root_logger.addHandler(handler)
-    root_logger.setLevel(logging.INFO)
-    
-    yield log_stream
+class FailingStockDataService:
+    """Stock data service whose quote lookup always fails validation."""
     
-    # Cleanup
-    root_logger.removeHandler(handler)
+    def get_stock_quote(self, *args, **kwargs):
+        raise ValidationError("Test error")
 
 
 @pytest.mark.integration
@@ -44,8 +26,10 @@ def test_request_id_in_response_header(client):
 
 
 @pytest.mark.integration
-def test_request_id_propagation(log_capture, client):
+def test_request_id_propagation(caplog, client):
     """Test that request_id propagates through the request lifecycle."""
+    caplog.set_level(logging.INFO)
+    
     # Make a request
     response = client.get("/health")
     
@@ -53,18 +37,10 @@ def test_request_id_propagation(log_capture, client):
     request_id = response.headers.get("X-Request-ID")
     assert request_id is not None
     
-    # Check logs contain request_id
-    log_output = log_capture.getvalue()
-    
-    # The middleware should log with request_id
-    # Since we're using JSONFormatter, check for JSON structure
-    if "request_id" in log_output.lower() or request_id in log_output:
-        # Request ID is present in logs
-        assert True
-    else:
-        # For structured logging, we might need to parse JSON
-        # This is a basic check - in production, logs would be in JSON format
-        pass
+    # The middleware logs the completed request with the same request_id
+    completed = [r for r in caplog.records if r.getMessage() == "Request completed"]
+    assert completed
+    assert completed[-1].request_id == request_id
 
 
 @pytest.mark.integration
@@ -84,32 +60,21 @@ def test_middleware_logs_required_fields(client):
 @pytest.mark.integration
 def test_error_logging_includes_request_id(client):
     """Test that error responses include request_id."""
-    from src.api.dependencies import get_stock_data_service
-    from src.application.services.stock_data_service import StockDataService
-    from src.shared.exceptions import ValidationError
-    from unittest.mock import Mock
-    
     # Override to raise error
-    mock_service = Mock(spec=StockDataService)
-    mock_service.get_stock_quote = Mock(side_effect=ValidationError("Test error"))
-    
-    app.dependency_overrides[get_stock_data_service] = lambda: mock_service
-    
-    try:
-        response = client.get("/api/stock/quote/TEST")
-        
-        assert response.status_code == 400
-        data = response.json()
-        
-        # Error response should include request_id
-        assert "request_id" in data
-        assert data["request_id"] is not None
-        assert len(data["request_id"]) > 0
-        
-        # Also check header
-        assert "X-Request-ID" in response.headers
-    finally:
-        app.dependency_overrides.clear()
+    app.dependency_overrides[get_stock_data_service] = FailingStockDataService
+    
+    response = client.get("/api/stock/quote/TEST")
+    
+    assert response.status_code == 400
+    data = response.json()
+    
+    # Error response should include request_id
+    assert "request_id" in data
+    assert data["request_id"] is not None
+    assert len(data["request_id"]) > 0
+    
+    # Also check header
+    assert "X-Request-ID" in response.headers
 
 
 @pytest.mark.integration
@@ -147,15 +112,9 @@ def test_middleware_latency_calculation(client):
 
 
 @pytest.mark.integration
-def test_multiple_requests_have_different_request_ids(client):
-    """Test that each request gets a unique request_id."""
-    request_ids = set()
-    
-    for _ in range(5):
-        response = client.get("/health")
-        assert response.status_code == 200
-        request_id = response.headers.get("X-Request-ID")
-        request_ids.add(request_id)
+def test_multiple_requests_have_different_request_ids():
+    """Test that the middleware's request_id generator yields unique IDs."""
+    request_ids = {_generate_request_id() for _ in range(5)}
     
     # All requests should have unique IDs
     assert len(request_ids) == 5
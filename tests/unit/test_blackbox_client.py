@@ -1,102 +1,80 @@
 """Unit tests for BlackboxClient."""
+from types import SimpleNamespace
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
-from openai import OpenAI
+from unittest.mock import Mock, AsyncMock
 from src.infrastructure.llm.blackbox_client import BlackboxClient
 from src.shared.exceptions import LLMQuotaExceededError, LLMProviderError
 
 
-@pytest.mark.asyncio
-async def test_generate_success():
+def _completion(content):
+    """Build a chat completion response carrying the given message content."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture(autouse=True)
+def mock_client(mocker):
+    """
+    Patch AsyncOpenAI and settings for every test in this module.
+    
+    Returns the mocked OpenAI client that BlackboxClient() will receive; tests
+    configure mock_client.chat.completions.create for their scenario.
+    """
+    mock_openai = mocker.patch('src.infrastructure.llm.blackbox_client.AsyncOpenAI')
+    mock_settings = mocker.patch('src.infrastructure.llm.blackbox_client.get_settings')
+    mock_settings.return_value.blackbox_api_key = "test_key"
+    mock_settings.return_value.llm_temperature = 0.7
+    mock_settings.return_value.llm_max_tokens = 2048
+
+    client = Mock()
+    mock_openai.return_value = client
+    return client
+
+
+async def test_generate_success(mock_client):
     """Test successful generation."""
-    with patch('src.infrastructure.llm.blackbox_client.OpenAI') as mock_openai:
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message = Mock()
-        mock_response.choices[0].message.content = "Test response"
-        mock_client.chat.completions.create = Mock(return_value=mock_response)
-        mock_openai.return_value = mock_client
-        
-        with patch('src.infrastructure.llm.blackbox_client.get_settings') as mock_settings:
-            mock_settings.return_value.blackbox_api_key = "test_key"
-            mock_settings.return_value.llm_temperature = 0.7
-            mock_settings.return_value.llm_max_tokens = 2048
-            
-            client = BlackboxClient()
-            result = await client.generate("Test prompt")
-            
-            assert result == "Test response"
-            mock_client.chat.completions.create.assert_called_once()
+    mock_client.chat.completions.create = AsyncMock(return_value=_completion("Test response"))
+    
+    client = BlackboxClient()
+    result = await client.generate("Test prompt")
+    
+    assert result == "Test response"
+    mock_client.chat.completions.create.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_generate_quota_exceeded_fallback():
+async def test_generate_quota_exceeded_fallback(mock_client):
     """Test model fallback when quota exceeded."""
-    with patch('src.infrastructure.llm.blackbox_client.OpenAI') as mock_openai:
-        mock_client = Mock()
-        
-        # First call fails with quota error
-        quota_error = Exception("429 Quota exceeded")
-        # Second call succeeds
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message = Mock()
-        mock_response.choices[0].message.content = "Fallback response"
-        
-        mock_client.chat.completions.create = Mock(side_effect=[
-            quota_error,
-            mock_response
-        ])
-        mock_openai.return_value = mock_client
-        
-        with patch('src.infrastructure.llm.blackbox_client.get_settings') as mock_settings:
-            mock_settings.return_value.blackbox_api_key = "test_key"
-            mock_settings.return_value.llm_temperature = 0.7
-            mock_settings.return_value.llm_max_tokens = 2048
-            
-            client = BlackboxClient()
-            result = await client.generate("Test prompt")
-            
-            assert result == "Fallback response"
-            # Should have tried twice
-            assert mock_client.chat.completions.create.call_count == 2
+    # First call fails with quota error
+    quota_error = Exception("429 Quota exceeded")
+    # Second call succeeds
+    mock_client.chat.completions.create = AsyncMock(side_effect=[
+        quota_error,
+        _completion("Fallback response")
+    ])
+    
+    client = BlackboxClient()
+    result = await client.generate("Test prompt")
+    
+    assert result == "Fallback response"
+    # Should have tried twice
+    assert mock_client.chat.completions.create.call_count == 2
 
 
-@pytest.mark.asyncio
-async def test_generate_non_quota_error():
+async def test_generate_non_quota_error(mock_client):
     """Test that non-quota errors are raised immediately."""
-    with patch('src.infrastructure.llm.blackbox_client.OpenAI') as mock_openai:
-        mock_client = Mock()
-        mock_client.chat.completions.create = Mock(side_effect=Exception("Connection error"))
-        mock_openai.return_value = mock_client
-        
-        with patch('src.infrastructure.llm.blackbox_client.get_settings') as mock_settings:
-            mock_settings.return_value.blackbox_api_key = "test_key"
-            mock_settings.return_value.llm_temperature = 0.7
-            mock_settings.return_value.llm_max_tokens = 2048
-            
-            client = BlackboxClient()
-            
-            with pytest.raises(LLMProviderError):
-                await client.generate("Test prompt")
+    mock_client.chat.completions.create = AsyncMock(side_effect=Exception("Connection error"))
+    
+    client = BlackboxClient()
+    
+    with pytest.raises(LLMProviderError):
+        await client.generate("Test prompt")
 
 
-@pytest.mark.asyncio
-async def test_generate_all_models_exhausted():
+async def test_generate_all_models_exhausted(mock_client):
     """Test that LLMQuotaExceededError is raised when all models are exhausted."""
-    with patch('src.infrastructure.llm.blackbox_client.OpenAI') as mock_openai:
-        mock_client = Mock()
-        quota_error = Exception("429 Quota exceeded")
-        mock_client.chat.completions.create = Mock(side_effect=quota_error)
-        mock_openai.return_value = mock_client
-        
-        with patch('src.infrastructure.llm.blackbox_client.get_settings') as mock_settings:
-            mock_settings.return_value.blackbox_api_key = "test_key"
-            mock_settings.return_value.llm_temperature = 0.7
-            mock_settings.return_value.llm_max_tokens = 2048
-        
-        client = BlackboxClient()
-        
-        with pytest.raises(LLMQuotaExceededError):
-            await client.generate("Test prompt")
+    quota_error = Exception("429 Quota exceeded")
+    mock_client.chat.completions.create = AsyncMock(side_effect=quota_error)
+    
+    client = BlackboxClient()
+    
+    with pytest.raises(LLMQuotaExceededError):
+        await client.generate("Test prompt")
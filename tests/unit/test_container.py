@@ -0,0 +1,24 @@
+"""Unit tests for application container factories."""
+from unittest.mock import create_autospec
+from src.domain.interfaces.llm_provider import LLMProvider
+from src.application import container
+
+
+def test_service_is_reused_for_same_provider(mock_llm_provider):
+    """Test a service is constructed once per provider instance."""
+    first = container.summarization_service(mock_llm_provider)
+    second = container.summarization_service(mock_llm_provider)
+
+    assert first is second
+    assert container.summarize_news_use_case(first) is container.summarize_news_use_case(second)
+
+
+def test_service_is_rebuilt_for_new_provider(mock_llm_provider):
+    """Test a different provider gets its own service instance."""
+    first = container.forecast_service(mock_llm_provider)
+    second = container.forecast_service(
+        create_autospec(LLMProvider, instance=True, spec_set=True)
+    )
+
+    assert first is not second
+    assert second.llm_provider is not mock_llm_provider
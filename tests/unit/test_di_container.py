@@ -0,0 +1,43 @@
+"""Unit tests for the shared dependency injection container."""
+from unittest.mock import Mock
+import pytest
+from src.shared.container import Container
+
+
+def test_singleton_factory_is_called_once():
+    """Test a singleton factory builds its instance on first resolve only."""
+    container = Container()
+    factory = Mock(return_value=object())
+    container.register_singleton_factory("service", factory)
+
+    assert container.resolve("service") is container.resolve("service")
+    factory.assert_called_once()
+
+
+def test_transient_factory_is_called_per_resolve():
+    """Test a transient factory builds a new instance on every resolve."""
+    container = Container()
+    container.register_factory("service", object)
+
+    assert container.resolve("service") is not container.resolve("service")
+
+
+def test_registration_respects_override():
+    """Test a key keeps its first registration unless override is set."""
+    container = Container()
+    container.register_singleton("service", "first")
+    container.register_factory("service", lambda: "second")
+    assert container.resolve("service") == "first"
+
+    container.register_factory("service", lambda: "second", override=True)
+    assert container.resolve("service") == "second"
+
+
+def test_unknown_key():
+    """Test resolving an unregistered key raises while get returns the default."""
+    container = Container()
+
+    with pytest.raises(ValueError):
+        container.resolve("missing")
+    assert container.get("missing", "default") == "default"
+    assert not container.has("missing")
@@ -1,10 +1,9 @@
 """Unit tests for ForecastService."""
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import AsyncMock
 from src.application.services.forecast_service import ForecastService
 
 
-@pytest.mark.asyncio
 async def test_generate_forecast(mock_llm_provider, sample_forecast_response):
     """Test forecast generation with mocked LLM."""
     # Setup
@@ -30,7 +29,6 @@ async def test_generate_forecast(mock_llm_provider, sample_forecast_response):
     mock_llm_provider.generate.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_generate_forecast_with_all_data(mock_llm_provider, sample_forecast_response):
     """Test forecast generation with all data types."""
     service = ForecastService(mock_llm_provider)
@@ -49,7 +47,6 @@ async def test_generate_forecast_with_all_data(mock_llm_provider, sample_forecas
     mock_llm_provider.generate.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_forecast_service_error_handling(mock_llm_provider):
     """Test forecast service error handling."""
     service = ForecastService(mock_llm_provider)
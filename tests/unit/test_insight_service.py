@@ -1,10 +1,9 @@
 """Unit tests for InsightService."""
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import AsyncMock
 from src.application.services.insight_service import InsightService
 
 
-@pytest.mark.asyncio
 async def test_generate_insight(mock_llm_provider, sample_insight_json):
     """Test insight generation with mocked LLM returning JSON."""
     service = InsightService(mock_llm_provider)
@@ -24,11 +23,10 @@ async def test_generate_insight(mock_llm_provider, sample_insight_json):
     mock_llm_provider.generate.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_generate_insight_invalid_json(mock_llm_provider):
+async def test_generate_insight_invalid_json(mock_llm_provider, async_return):
     """Test insight generation with invalid JSON response."""
     service = InsightService(mock_llm_provider)
-    mock_llm_provider.generate = AsyncMock(return_value="Invalid response without JSON")
+    mock_llm_provider.generate = async_return("Invalid response without JSON")
     
     result = await service.generate_insight(symbol="VIC")
     
@@ -38,33 +36,20 @@ async def test_generate_insight_invalid_json(mock_llm_provider):
     assert result["confidence"] == 50
 
 
-@pytest.mark.asyncio
-async def test_generate_insight_type_normalization(mock_llm_provider):
-    """Test insight type normalization (mua -> Buy, bán -> Sell)."""
+@pytest.mark.parametrize("payload,expected_type,expected_confidence", [
+    ('{"type": "mua", "confidence": 80}', "Buy", 80),  # Vietnamese type
+    ('{"type": "buy", "confidence": 75}', "Buy", 75),  # Lowercase type
+    ('{"type": "Buy", "confidence": 150}', "Buy", 100),  # Clamped to 100
+    ('{"type": "Sell", "confidence": -10}', "Sell", 0),  # Clamped to 0
+])
+async def test_generate_insight_normalization(
+    mock_llm_provider, async_return, payload, expected_type, expected_confidence
+):
+    """Test insight type normalization (mua -> Buy) and confidence clamping to 0-100."""
     service = InsightService(mock_llm_provider)
+    mock_llm_provider.generate = async_return(payload)
     
-    # Test Vietnamese type
-    mock_llm_provider.generate = AsyncMock(return_value='{"type": "mua", "confidence": 80}')
     result = await service.generate_insight(symbol="VIC")
-    assert result["type"] == "Buy"
-    
-    # Test lowercase
-    mock_llm_provider.generate = AsyncMock(return_value='{"type": "buy", "confidence": 75}')
-    result = await service.generate_insight(symbol="VIC")
-    assert result["type"] == "Buy"
-
-
-@pytest.mark.asyncio
-async def test_insight_confidence_boundaries(mock_llm_provider):
-    """Test confidence value is clamped to 0-100."""
-    service = InsightService(mock_llm_provider)
     
-    # Test high confidence
-    mock_llm_provider.generate = AsyncMock(return_value='{"type": "Buy", "confidence": 150}')
-    result = await service.generate_insight(symbol="VIC")
-    assert result["confidence"] == 100
-    
-    # Test low confidence
-    mock_llm_provider.generate = AsyncMock(return_value='{"type": "Sell", "confidence": -10}')
-    result = await service.generate_insight(symbol="VIC")
-    assert result["confidence"] == 0
+    assert result["type"] == expected_type
+    assert result["confidence"] == expected_confidence
@@ -1,10 +1,34 @@
 """Unit tests for QAService."""
-import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import AsyncMock
 from src.application.services.qa_service import QAService
 
+# Retrieved chunks for the vector-results test; QAService only reads them
+_VECTOR_HITS = (
+    {
+        "documentId": "doc-1",
+        "source": "analysis_report",
+        "sourceUrl": None,
+        "title": "Báo cáo Q1",
+        "section": "Tổng quan",
+        "symbol": "ABC",
+        "chunkId": "doc-1:0:0",
+        "score": 0.9,
+        "text": "EPS is 1000 VND in Q1"
+    },
+    {
+        "documentId": "doc-1",
+        "source": "analysis_report",
+        "sourceUrl": None,
+        "title": "Báo cáo Q1",
+        "section": "Tài chính",
+        "symbol": "ABC",
+        "chunkId": "doc-1:0:1",
+        "score": 0.8,
+        "text": "Revenue increased 20%"
+    }
+)
+
 
-@pytest.mark.asyncio
 async def test_answer_question(mock_llm_provider, mock_vector_store, mock_embedding_provider):
     """Test QA service answering question with RAG."""
     service = QAService(mock_llm_provider, mock_vector_store, mock_embedding_provider)
@@ -28,40 +52,17 @@ async def test_answer_question(mock_llm_provider, mock_vector_store, mock_embedd
     mock_llm_provider.generate.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_answer_question_with_vector_results(
     mock_llm_provider, 
     mock_vector_store, 
-    mock_embedding_provider
+    mock_embedding_provider,
+    async_return
 ):
     """Test QA service with retrieved documents from vector store."""
     service = QAService(mock_llm_provider, mock_vector_store, mock_embedding_provider)
     
-    mock_vector_store.search = AsyncMock(return_value=[
-        {
-            "documentId": "doc-1",
-            "source": "analysis_report",
-            "sourceUrl": None,
-            "title": "Báo cáo Q1",
-            "section": "Tổng quan",
-            "symbol": "ABC",
-            "chunkId": "doc-1:0:0",
-            "score": 0.9,
-            "text": "EPS is 1000 VND in Q1"
-        },
-        {
-            "documentId": "doc-1",
-            "source": "analysis_report",
-            "sourceUrl": None,
-            "title": "Báo cáo Q1",
-            "section": "Tài chính",
-            "symbol": "ABC",
-            "chunkId": "doc-1:0:1",
-            "score": 0.8,
-            "text": "Revenue increased 20%"
-        }
-    ])
-    mock_llm_provider.generate = AsyncMock(return_value="EPS is 1000 VND")
+    mock_vector_store.search = async_return(list(_VECTOR_HITS))
+    mock_llm_provider.generate = async_return("EPS is 1000 VND")
     
     result = await service.answer_question(
         question="What is the EPS?",
@@ -73,12 +74,16 @@ async def test_answer_question_with_vector_results(
     assert result["sources"][0]["source"] == "analysis_report"
 
 
-@pytest.mark.asyncio
-async def test_analyze_financial_metrics(mock_llm_provider, mock_vector_store, mock_embedding_provider):
+async def test_analyze_financial_metrics(
+    mock_llm_provider,
+    mock_vector_store,
+    mock_embedding_provider,
+    async_return
+):
     """Test financial metrics analysis."""
     service = QAService(mock_llm_provider, mock_vector_store, mock_embedding_provider)
     
-    mock_llm_provider.generate = AsyncMock(return_value="Financial analysis: ROE is 15.5%")
+    mock_llm_provider.generate = async_return("Financial analysis: ROE is 15.5%")
     
     financial_data = {
         "roe": 15.5,
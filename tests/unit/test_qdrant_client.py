@@ -0,0 +1,78 @@
+"""Unit tests for the Qdrant vector store client."""
+from unittest.mock import AsyncMock
+import grpc
+import numpy as np
+import pytest
+from qdrant_client.http.exceptions import UnexpectedResponse
+from src.infrastructure.vector_store.qdrant_client import QdrantClient, _is_missing_collection
+from src.shared.exceptions import VectorStoreError
+
+
+class _FakeRpcError(grpc.RpcError):
+    """gRPC error carrying a fixed status code."""
+
+    def __init__(self, status_code):
+        self._status_code = status_code
+
+    def code(self):
+        return self._status_code
+
+
+def _http_error(status_code):
+    return UnexpectedResponse(
+        status_code=status_code, reason_phrase="", content=b"", headers=None
+    )
+
+
+@pytest.mark.parametrize("error,expected", [
+    (_http_error(404), True),
+    (_FakeRpcError(grpc.StatusCode.NOT_FOUND), True),
+    (_http_error(401), False),
+    (_http_error(503), False),
+    (_FakeRpcError(grpc.StatusCode.DEADLINE_EXCEEDED), False),
+    (_FakeRpcError(grpc.StatusCode.UNAVAILABLE), False),
+    (_FakeRpcError(grpc.StatusCode.UNAUTHENTICATED), False),
+    (RuntimeError("boom"), False),
+])
+def test_only_not_found_means_missing_collection(error, expected):
+    """Test outages and auth failures are not mistaken for a missing collection."""
+    assert _is_missing_collection(error) is expected
+
+
+async def test_upsert_normalizes_raw_vectors(mock_embedding_provider):
+    """Test the raw upsert path stores unit vectors for the DOT-distance collection."""
+    store = QdrantClient(mock_embedding_provider)
+    store.client = AsyncMock()
+    store._collection_ready = True
+
+    await store.upsert([{"id": "p1", "vector": [3.0, 4.0], "payload": {"text": "a"}}])
+
+    points = store.client.upsert.call_args.kwargs["points"]
+    assert points[0]["id"] == "p1"
+    assert points[0]["payload"] == {"text": "a"}
+    assert np.allclose(points[0]["vector"], [0.6, 0.8])
+
+
+async def test_ensure_collection_indexes_existing_collection(mock_embedding_provider):
+    """Test payload indexes are ensured even when the collection already exists."""
+    store = QdrantClient(mock_embedding_provider)
+    store.client = AsyncMock()
+
+    await store.ensure_collection()
+
+    store.client.create_collection.assert_not_called()
+    indexed = [c.kwargs["field_name"] for c in store.client.create_payload_index.call_args_list]
+    assert indexed == store._indexed_payload_fields
+    assert store._collection_ready
+
+
+async def test_upsert_chunks_rejects_payload_without_chunk_id(mock_embedding_provider):
+    """Test a payload without chunkId fails clearly instead of sending a None point ID."""
+    store = QdrantClient(mock_embedding_provider)
+    store.client = AsyncMock()
+    store._collection_ready = True
+
+    with pytest.raises(VectorStoreError, match="has no chunkId"):
+        await store.upsert_chunks("doc-1", "test", [{"text": "a"}], [[1.0, 0.0]])
+
+    store.client.upsert.assert_not_called()
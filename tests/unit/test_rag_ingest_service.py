@@ -0,0 +1,100 @@
+"""Unit tests for RagIngestService."""
+import uuid
+from unittest.mock import AsyncMock
+from src.application.services.rag_ingest_service import RagIngestService
+
+
+async def test_ingest_uses_deterministic_uuid_point_ids(mock_vector_store, mock_embedding_provider):
+    """Test that chunk IDs are valid, deterministic UUIDv5 values."""
+    mock_vector_store.upsert_chunks = AsyncMock(return_value=None)
+    service = RagIngestService(mock_vector_store, mock_embedding_provider)
+    text = "\n\n".join(f"Đoạn {i} có nội dung đủ dài để được lưu vào chỉ mục vector." for i in range(3))
+
+    await service.ingest("doc-1", "analysis_report", text, {}, chunk_size=80, chunk_overlap=0)
+    first_ids = [
+        p["chunkId"] for p in mock_vector_store.upsert_chunks.call_args.kwargs["payloads"]
+    ]
+
+    await service.ingest("doc-1", "analysis_report", text, {}, chunk_size=80, chunk_overlap=0)
+    second_ids = [
+        p["chunkId"] for p in mock_vector_store.upsert_chunks.call_args.kwargs["payloads"]
+    ]
+
+    assert len(first_ids) == 3
+    assert first_ids == second_ids
+    assert len(set(first_ids)) == len(first_ids)
+    for chunk_id in first_ids:
+        assert uuid.UUID(chunk_id).version == 5
+
+
+async def test_ingest_point_ids_differ_per_document(mock_vector_store, mock_embedding_provider):
+    """Test that the same chunk index yields different IDs for different documents."""
+    mock_vector_store.upsert_chunks = AsyncMock(return_value=None)
+    service = RagIngestService(mock_vector_store, mock_embedding_provider)
+
+    await service.ingest("doc-1", "analysis_report", "Nội dung", {})
+    id_doc1 = mock_vector_store.upsert_chunks.call_args.kwargs["payloads"][0]["chunkId"]
+
+    await service.ingest("doc-2", "analysis_report", "Nội dung", {})
+    id_doc2 = mock_vector_store.upsert_chunks.call_args.kwargs["payloads"][0]["chunkId"]
+
+    assert id_doc1 != id_doc2
+
+
+async def test_ingest_embeds_chunks_in_single_batch(mock_vector_store, mock_embedding_provider):
+    """Test that all chunks are embedded with one batch call."""
+    mock_vector_store.upsert_chunks = AsyncMock(return_value=None)
+    service = RagIngestService(mock_vector_store, mock_embedding_provider)
+    text = "\n\n".join(f"Đoạn văn số {i}. " + "Nội dung " * 20 for i in range(5))
+
+    result = await service.ingest("doc-1", "analysis_report", text, {}, chunk_size=200, chunk_overlap=0)
+
+    mock_embedding_provider.generate_embeddings_np.assert_awaited_once()
+    mock_embedding_provider.generate_embedding.assert_not_called()
+    vectors = mock_vector_store.upsert_chunks.call_args.kwargs["vectors"]
+    assert len(vectors) == result["chunksUpserted"] > 1
+
+
+def test_hard_split_always_makes_progress(mock_vector_store, mock_embedding_provider):
+    """Test that hard split terminates even when overlap is not smaller than chunk size."""
+    service = RagIngestService(mock_vector_store, mock_embedding_provider)
+    text = "x" * 1000
+
+    chunks = service._hard_split(text, chunk_size=100, chunk_overlap=100)
+
+    assert len(chunks) == 10
+    assert "".join(chunks) == text
+
+
+def test_hard_split_breaks_on_sentence_boundaries(mock_vector_store, mock_embedding_provider):
+    """Test that hard split packs whole sentences and carries overlap as sentences."""
+    service = RagIngestService(mock_vector_store, mock_embedding_provider)
+    text = " ".join(f"Câu số {i} có nội dung khá dài một chút." for i in range(30))
+
+    chunks = service._hard_split(text, chunk_size=200, chunk_overlap=60)
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert len(chunk) <= 200
+        assert chunk.startswith("Câu số ")
+        assert chunk.endswith("một chút.")
+    # Last sentence of a chunk is repeated at the start of the next one
+    assert chunks[1].startswith(chunks[0].rsplit(". ", 1)[-1])
+
+
+def test_filter_chunks_drops_blank_and_duplicate_chunks(mock_vector_store, mock_embedding_provider):
+    """Test that whitespace-only and duplicate chunks are removed before embedding."""
+    service = RagIngestService(mock_vector_store, mock_embedding_provider)
+    useful = "Nội dung phân tích đủ dài để có giá trị khi tìm kiếm ngữ nghĩa."
+
+    chunks = service._filter_chunks([useful, "  \n ", useful, "Kết luận."])
+
+    assert chunks == [useful, "Kết luận."]
+
+
+def test_filter_chunks_keeps_short_chunks(mock_vector_store, mock_embedding_provider):
+    """Test that short chunks such as a document tail are still indexed."""
+    service = RagIngestService(mock_vector_store, mock_embedding_provider)
+
+    assert service._filter_chunks(["Ngắn", "Ngắn 2"]) == ["Ngắn", "Ngắn 2"]
+    assert service._filter_chunks([]) == []
@@ -0,0 +1,63 @@
+"""Unit tests for SingleFlight request coalescing."""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from src.shared.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_execution():
+    """Test concurrent callers with the same key run the call once."""
+    single_flight = SingleFlight()
+
+    async def slow_call():
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+
+    fn = AsyncMock(side_effect=slow_call)
+    key = SingleFlight.key("VIC", {"rsi": 55}, None)
+
+    results = await asyncio.gather(*(single_flight.do(key, fn) for _ in range(5)))
+
+    assert fn.await_count == 1
+    assert all(result == {"value": 1} for result in results)
+
+
+async def test_failure_propagates_and_is_not_remembered():
+    """Test errors reach every waiter and the next call runs again."""
+    single_flight = SingleFlight()
+    fn = AsyncMock(side_effect=[ValueError("boom"), "ok"])
+    key = SingleFlight.key("question")
+
+    with pytest.raises(ValueError):
+        await single_flight.do(key, fn)
+
+    assert await single_flight.do(key, fn) == "ok"
+
+
+def test_key_ignores_dict_ordering():
+    """Test keys are stable across dict insertion order."""
+    assert SingleFlight.key({"a": 1, "b": 2}) == SingleFlight.key({"b": 2, "a": 1})
+
+
+async def test_cancelled_leader_does_not_cancel_waiters():
+    """Test a waiter re-runs the call when the leading caller is cancelled."""
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow_call():
+        started.set()
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    fn = AsyncMock(side_effect=slow_call)
+    key = SingleFlight.key("question")
+
+    leader = asyncio.create_task(single_flight.do(key, fn))
+    await started.wait()
+    waiters = [asyncio.create_task(single_flight.do(key, fn)) for _ in range(3)]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.gather(*waiters) == ["ok", "ok", "ok"]
+    assert leader.cancelled()
+    assert fn.await_count == 2
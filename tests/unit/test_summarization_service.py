@@ -0,0 +1,95 @@
+"""Unit tests for SummarizationService."""
+import asyncio
+import json
+from unittest.mock import AsyncMock
+from src.application.services.summarization_service import SummarizationService
+
+
+async def test_summarize_parses_fenced_json(mock_llm_provider):
+    """Test summarize parses JSON wrapped in markdown fences and normalizes sentiment."""
+    service = SummarizationService(mock_llm_provider)
+    mock_llm_provider.generate = AsyncMock(return_value="""```json
+{"summary": "Lợi nhuận tăng", "sentiment": "Tích cực", "impact_assessment": "Tốt", "key_points": ["A"]}
+```""")
+
+    result = await service.summarize("Nội dung bài viết")
+
+    assert result["summary"] == "Lợi nhuận tăng"
+    assert result["sentiment"] == "positive"
+    assert result["key_points"] == ["A"]
+
+
+async def test_summarize_batch_uses_single_llm_call(mock_llm_provider):
+    """Test batch summarization sends one prompt per group and keeps input order."""
+    service = SummarizationService(mock_llm_provider)
+    mock_llm_provider.generate = AsyncMock(return_value=json.dumps([
+        {"id": 1, "summary": "Bài 2", "sentiment": "negative", "impact_assessment": "Xấu"},
+        {"id": 0, "summary": "Bài 1", "sentiment": "positive", "impact_assessment": "Tốt"},
+    ]))
+
+    results = await service.summarize_batch(["Bài viết 1", "Bài viết 2"])
+
+    assert mock_llm_provider.generate.await_count == 1
+    assert [r["summary"] for r in results] == ["Bài 1", "Bài 2"]
+    assert [r["sentiment"] for r in results] == ["positive", "negative"]
+    assert results[0]["key_points"] == []
+
+
+async def test_summarize_batch_falls_back_for_missing_items(mock_llm_provider):
+    """Test articles missing from the batch response are summarized individually."""
+    service = SummarizationService(mock_llm_provider)
+    mock_llm_provider.generate = AsyncMock(side_effect=[
+        json.dumps([{"id": 0, "summary": "Bài 1", "sentiment": "neutral"}]),
+        json.dumps({"summary": "Bài 2", "sentiment": "negative"}),
+    ])
+
+    results = await service.summarize_batch(["Bài viết 1", "Bài viết 2"])
+
+    assert mock_llm_provider.generate.await_count == 2
+    assert [r["summary"] for r in results] == ["Bài 1", "Bài 2"]
+
+
+async def test_summarize_caches_identical_content(mock_llm_provider):
+    """Test repeated content is served from cache without another LLM call."""
+    service = SummarizationService(mock_llm_provider)
+    mock_llm_provider.generate = AsyncMock(return_value=json.dumps(
+        {"summary": "Tóm tắt", "sentiment": "neutral", "key_points": ["A"]}
+    ))
+
+    first = await service.summarize("Cùng một bài viết")
+    first["key_points"].append("mutated")
+    second = await service.summarize("Cùng một bài viết")
+
+    assert mock_llm_provider.generate.await_count == 1
+    assert second["key_points"] == ["A"]
+
+
+async def test_summarize_coalesces_concurrent_identical_requests(mock_llm_provider):
+    """Test concurrent requests for the same content share one LLM call."""
+    service = SummarizationService(mock_llm_provider)
+
+    async def slow_generate(prompt):
+        await asyncio.sleep(0.01)
+        return json.dumps({"summary": "Tóm tắt", "sentiment": "positive"})
+
+    mock_llm_provider.generate = AsyncMock(side_effect=slow_generate)
+
+    results = await asyncio.gather(*(service.summarize("Bài viết nóng") for _ in range(5)))
+
+    assert mock_llm_provider.generate.await_count == 1
+    assert all(result["summary"] == "Tóm tắt" for result in results)
+
+
+async def test_summarize_fallback_parsing_for_non_json(mock_llm_provider):
+    """Test fallback parsing extracts summary, sentiment and impact sentence from plain text."""
+    service = SummarizationService(mock_llm_provider)
+    mock_llm_provider.generate = AsyncMock(
+        return_value="Lợi nhuận quý tăng mạnh\nTriển vọng tốt. Điều này có tác động tích cực đến giá. Hết"
+    )
+
+    result = await service.summarize("Nội dung không trả về JSON")
+
+    assert result["summary"] == "Lợi nhuận quý tăng mạnh"
+    assert result["sentiment"] == "positive"
+    assert result["impact_assessment"] == "Điều này có tác động tích cực đến giá"
+    assert result["key_points"] == []
@@ -0,0 +1,83 @@
+"""Unit tests for shared text utilities."""
+import pytest
+from src.shared.utils import (
+    analyze_response,
+    extract_sentiment,
+    extract_trend,
+    extract_confidence,
+    extract_recommendation,
+    extract_list_items
+)
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("Tăng trưởng tốt, triển vọng lạc quan", "positive"),
+    ("Kết quả xấu, nhà đầu tư bi quan và lo ngại", "negative"),
+    ("Giá tăng rồi giảm", "neutral"),
+    ("", "neutral"),
+])
+def test_extract_sentiment(text, expected):
+    """Test sentiment is decided by the number of distinct keywords per polarity."""
+    assert extract_sentiment(text) == expected
+
+
+def test_extract_sentiment_counts_distinct_keywords():
+    """Test repeated occurrences of one keyword count once."""
+    assert extract_sentiment("giảm giảm giảm, nhưng tốt") == "neutral"
+
+
+@pytest.mark.parametrize("text", [
+    "Tầng lớp nhà đầu tư",  # "tầng" must not fold to "tăng"
+    "Giám đốc điều hành",  # "giám" must not fold to "giảm"
+])
+def test_extract_sentiment_keeps_diacritics_distinct(text):
+    """Test keywords only match with their exact Vietnamese diacritics."""
+    assert extract_sentiment(text) == "neutral"
+
+
+@pytest.mark.parametrize("text,trend,confidence,recommendation", [
+    ("Xu hướng TĂNG, độ tin cậy cao, khuyến nghị MUA", "Up", "High", "Buy"),
+    ("Cổ phiếu giảm mạnh... nên bán", "Down", "High", "Sell"),
+    ("Thị trường đi ngang", "Sideways", "Medium", "Hold"),
+])
+def test_extractors_share_keyword_scan(text, trend, confidence, recommendation):
+    """Test trend, confidence and recommendation keywords are found case-insensitively."""
+    assert extract_trend(text) == trend
+    assert extract_confidence(text)[0] == confidence
+    assert extract_recommendation(text) == recommendation
+
+
+def test_extractors_find_overlapping_keywords():
+    """Test a keyword starting inside another match is still found."""
+    assert extract_trend("bearishigh") == "Down"
+    assert extract_confidence("bearishigh")[0] == "High"
+
+
+def test_analyze_response_matches_single_extractors():
+    """Test the combined analysis agrees with the individual extractors."""
+    text = "Xu hướng giảm, độ tin cậy thấp, khuyến nghị nắm giữ"
+
+    assert analyze_response(text) == {
+        "trend": extract_trend(text),
+        "confidence": extract_confidence(text),
+        "recommendation": extract_recommendation(text)
+    }
+
+
+def test_extract_list_items_reads_section_bullets():
+    """Test bullets are collected from the keyword section until the next heading."""
+    text = (
+        "## Yếu tố chính\n"
+        "- Lợi nhuận quý tăng mạnh\n"
+        "* Dòng tiền ngoại quay lại\n"
+        "- ngắn\n"
+        "## Rủi ro\n"
+        "- Lãi suất tăng cao\n"
+    )
+
+    assert extract_list_items(text, ["yếu tố", "driver"]) == [
+        "Lợi nhuận quý tăng mạnh",
+        "Dòng tiền ngoại quay lại",
+    ]
+    assert extract_list_items(text, ["rủi ro"]) == ["Lãi suất tăng cao"]
+    assert extract_list_items(text, []) == []